@@ -47,7 +47,9 @@ Window {
     signal aboutToSave()
     property int lastClickedIndex: -1
     property bool hasSearched: false     // true after first search in this session
-    property var qualityOptions: []
+    property string pendingSearchKey: "" // query + year of the latest search
+    property var qualityOptions: [""]    // combo entries, "" = no quality
+    property string qualityTypesRaw: ""   // last list read from the config
 
     function clearSelection() {
         selectedIndices = ({})
@@ -100,12 +102,12 @@ Window {
     }
 
     function refreshQualityOptions() {
+        // The list rarely changes, so only rebuild it (and the combo model)
+        // when it has. The backend keeps it sorted.
         var raw = controller.getQualityTypes()
-        var arr = raw.split("\n")
-            .map(function(s) { return s.trim() })
-            .filter(function(s) { return s !== "" })
-            .sort(function(a, b) { return a.toLowerCase().localeCompare(b.toLowerCase()) })
-        qualityOptions = arr
+        if (raw === qualityTypesRaw) return
+        qualityTypesRaw = raw
+        qualityOptions = [""].concat(raw.split("\n").filter(function(s) { return s !== "" }))
     }
 
     function openAdd() {
@@ -137,40 +139,42 @@ Window {
         clearSelection()
         searchModel.clear()
 
-        // Load item data from MediaModel using role numbers
-        // MediaModel roles: ID=256, Title=257, NativeTitle=258, RomajiTitle=259,
-        //   Year=260, MediaType=261, Status=262, QualityType=263,
-        //   Source=264, Notes=265, PosterPath=266, HasPoster=267
-        var mi = mediaModel.index(row, 0)
-        editingId = mediaModel.data(mi, 256) || -1  // ID
-        titleField.text = mediaModel.data(mi, 257) || ""
-        nativeTitleField.text = mediaModel.data(mi, 258) || ""
-        romajiTitleField.text = mediaModel.data(mi, 259) || ""
-        var yr = mediaModel.data(mi, 260) || 0
-        yearField.text = yr > 0 ? String(yr) : ""
+        // Load the whole row in one call; keys are the model's role names
+        var item = mediaModel.getItem(row)
+        editingId = item.itemId || -1
+        fillFromItem(item)
 
         // Status combo
-        var status = mediaModel.data(mi, 262) || "On Drive"
+        var status = item.status || "On Drive"
         var statusIdx = statusCombo.find(status)
         statusCombo.currentIndex = statusIdx >= 0 ? statusIdx : 0
 
         // Quality combo
-        var quality = mediaModel.data(mi, 263) || ""
+        var quality = item.qualityType || ""
         var qualIdx = qualityCombo.find(quality)
         qualityCombo.currentIndex = qualIdx >= 0 ? qualIdx : 0
 
         // Source, Notes
-        sourceField.text = mediaModel.data(mi, 264) || ""
-        notesField.text = mediaModel.data(mi, 265) || ""
-
-        // Poster path (model already returns file:// prefixed)
-        var pp = mediaModel.data(mi, 266) || ""
-        if (pp.toString().startsWith("file://")) pp = pp.toString().substring(7)
-        posterUrlField.text = pp
+        sourceField.text = item.source || ""
+        notesField.text = item.notes || ""
 
         show()
     }
 
+    // Titles, year and poster from a getItem() row of either model; both
+    // use the same role names for these.
+    function fillFromItem(item) {
+        titleField.text = item.title || ""
+        nativeTitleField.text = item.nativeTitle || ""
+        romajiTitleField.text = item.romajiTitle || ""
+        var yr = item.year || 0
+        yearField.text = yr > 0 ? String(yr) : ""
+        // Local posters come back file:// prefixed
+        var pp = item.posterPath || ""
+        if (pp.startsWith("file://")) pp = pp.substring(7)
+        posterUrlField.text = pp
+    }
+
     function onSearchDone() {
         clearSelection()
     }
@@ -325,7 +329,14 @@ Window {
                                 Layout.fillHeight: true
                                 clip: true
                                 spacing: 4
-                                model: searchModel
+                                // Detached while editing, where the search
+                                // panel is hidden, so late results don't build
+                                // delegates or fetch thumbnails nobody sees.
+                                model: editWin.isEditing ? null : searchModel
+                                // Delegates have a fixed height and only
+                                // bind to model roles, so scrolled-out ones
+                                // can be recycled instead of recreated.
+                                reuseItems: true
 
                                 delegate: Rectangle {
                                     id: resultDelegate
@@ -354,10 +365,11 @@ Window {
 
                                             Image {
                                                 anchors.fill: parent
-                                                source: model.hasPoster ? model.posterPath : ""
+                                                source: model.hasPoster ? model.thumbPath : ""
                                                 fillMode: Image.PreserveAspectCrop
                                                 visible: model.hasPoster || false
                                                 asynchronous: true
+                                                sourceSize: Qt.size(36 * Screen.devicePixelRatio, 48 * Screen.devicePixelRatio)
                                             }
                                         }
 
@@ -384,7 +396,7 @@ Window {
                                                 font.pixelSize: 11
                                                 elide: Text.ElideRight
                                                 Layout.fillWidth: true
-                                                visible: (model.nativeTitle || "") !== ""
+                                                visible: text !== ""
                                             }
                                         }
 
@@ -483,6 +495,7 @@ Window {
                         visible: posterUrlField.text !== ""
 
                         Image {
+                            id: posterPreview
                             anchors.fill: parent
                             source: {
                                 if (posterUrlField.text === "") return ""
@@ -491,6 +504,21 @@ Window {
                             }
                             fillMode: Image.PreserveAspectCrop
                             asynchronous: true
+                            // Decode at the preview's fixed size. Qt's pixmap
+                            // cache keys on URL + sourceSize, so going back to
+                            // a poster shown before reuses the small decoded
+                            // copy instead of decoding the full image again.
+                            sourceSize: Qt.size(140 * Screen.devicePixelRatio, 210 * Screen.devicePixelRatio)
+                        }
+
+                        // Remote posters load in the background; show that
+                        // instead of an empty frame.
+                        Text {
+                            anchors.centerIn: parent
+                            text: "Loading..."
+                            color: _t.textMuted
+                            font.pixelSize: 12
+                            visible: posterPreview.status === Image.Loading
                         }
                     }
 
@@ -579,7 +607,7 @@ Window {
                                 Text { text: "Quality Type"; color: _t.textSecondary; font.pixelSize: 12; font.bold: true }
                                 ComboBox {
                                     id: qualityCombo; Layout.fillWidth: true
-                                    model: [""].concat(editWin.qualityOptions)
+                                    model: editWin.qualityOptions
                                     background: Rectangle { color: _t.surfaceDark; border.color: qualityCombo.activeFocus ? _t.accent : _t.borderSubtle; radius: 8; implicitHeight: 36 }
                                     contentItem: Text { leftPadding: 12; text: qualityCombo.displayText; color: _t.textPrimary; font.pixelSize: 13; verticalAlignment: Text.AlignVCenter }
                                     indicator: Text { x: qualityCombo.width - width - 8; anchors.verticalCenter: parent.verticalCenter; text: "▾"; color: _t.textMuted; font.pixelSize: 14 }
@@ -683,24 +711,19 @@ Window {
     function doSearch() {
         var q = searchQuery.text.trim()
         if (q === "") return
+        var y = parseInt(searchYear.text) || 0
+        // Enter in either field and the button all search; a repeat of the
+        // search still running would only restart it.
+        var key = q + "\n" + y
+        if (searching && key === pendingSearchKey) return
+        pendingSearchKey = key
         hasSearched = true
         clearSelection()
-        var y = parseInt(searchYear.text) || 0
         controller.searchOnline(q, y)
     }
 
     function autoFillFromResult(idx) {
-        // Read from searchModel roles
-        var mi = searchModel.index(idx, 0)
-        titleField.text = searchModel.data(mi, 256) || "" // Title role
-        nativeTitleField.text = searchModel.data(mi, 257) || ""
-        romajiTitleField.text = searchModel.data(mi, 258) || ""
-        var yr = searchModel.data(mi, 259) || 0
-        yearField.text = yr > 0 ? String(yr) : ""
-        // poster path
-        var pp = searchModel.data(mi, 261) || ""
-        if (pp.startsWith("file://")) pp = pp.substring(7)
-        posterUrlField.text = pp
+        fillFromItem(searchModel.getItem(idx))
     }
 
     function saveItem() {
@@ -3,9 +3,9 @@ import QtQuick.Layouts
 
 Rectangle {
     id: card
-    radius: _t.borderRadius
-    color: card.selected ? _t.accentBg : (cardMouse.containsMouse ? _t.surfaceCardHover : _t.surfaceCard)
-    border.color: card.selected ? _t.accent : (cardMouse.containsMouse ? _t.borderSubtle : "transparent")
+    radius: theme.borderRadius
+    color: card.selected ? theme.accentBg : (cardMouse.containsMouse ? theme.surfaceCardHover : theme.surfaceCard)
+    border.color: card.selected ? theme.accent : (cardMouse.containsMouse ? theme.borderSubtle : "transparent")
     border.width: card.selected ? 2 : 1
     clip: true
 
@@ -20,8 +20,9 @@ Rectangle {
     property string posterPath: ""
     property bool hasPoster: false
     property bool selected: false
-
-    Theme { id: _t }
+    // Passed in by the grid so all cards share one Theme object instead of
+    // each creating its own.
+    property QtObject theme
 
     ColumnLayout {
         anchors.fill: parent
@@ -31,7 +32,7 @@ Rectangle {
         Rectangle {
             Layout.fillWidth: true
             Layout.fillHeight: true
-            color: _t.surfaceDark
+            color: theme.surfaceDark
             clip: true
 
             Image {
@@ -40,6 +41,9 @@ Rectangle {
                 fillMode: Image.PreserveAspectCrop
                 visible: card.hasPoster
                 asynchronous: true
+                // Decode near card size rather than the full 500px poster.
+                // Fixed, so resizing the window doesn't reload every card.
+                sourceSize.width: 240 * Screen.devicePixelRatio
             }
 
             // No-poster placeholder
@@ -64,7 +68,7 @@ Rectangle {
 
                 Text {
                     text: card.title
-                    color: _t.textPrimary
+                    color: theme.textPrimary
                     font.pixelSize: 13
                     font.bold: true
                     elide: Text.ElideRight
@@ -77,13 +81,13 @@ Rectangle {
                     spacing: 6
                     Text {
                         text: card.year > 0 ? String(card.year) : ""
-                        color: _t.textMuted
+                        color: theme.textMuted
                         font.pixelSize: 11
                         visible: card.year > 0
                     }
                     Text {
                         text: card.qualityType
-                        color: _t.accentLight
+                        color: theme.accentLight
                         font.pixelSize: 11
                         visible: card.qualityType !== ""
                     }
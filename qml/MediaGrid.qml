@@ -12,6 +12,7 @@ Item {
     signal itemDoubleClicked(int row)
     signal itemRightClicked(int row, real mx, real my)
 
+    Theme { id: _t }
 
     function scrollY() {
         return gridView.contentY
@@ -21,12 +22,16 @@ Item {
         var maxY = Math.max(0, gridView.contentHeight - gridView.height)
         gridView.contentY = Math.max(0, Math.min(y, maxY))
     }
-    function isSelected(row) {
-        var id = model.getItemId(row)
-        for (var i = 0; i < selectedIds.length; i++) {
-            if (selectedIds[i] === id) return true
-        }
-        return false
+    // Built once per selection change, so each delegate's check is a
+    // lookup rather than a scan of selectedIds.
+    readonly property var selectedLookup: {
+        var lookup = {}
+        for (var i = 0; i < selectedIds.length; i++) lookup[selectedIds[i]] = true
+        return lookup
+    }
+
+    function isSelected(id) {
+        return selectedLookup[id] === true
     }
 
     GridView {
@@ -39,6 +44,9 @@ Item {
 
         clip: true
         boundsBehavior: Flickable.StopAtBounds
+        // Cards are pooled and rebound rather than destroyed and recreated,
+        // both while scrolling and when a reload resets the model.
+        reuseItems: true
         ScrollBar.vertical: ScrollBar {
             policy: ScrollBar.AlwaysOn
         }
@@ -50,13 +58,14 @@ Item {
             MediaCard {
                 anchors.fill: parent
                 anchors.margins: 6
+                theme: _t
                 title: model.title
                 nativeTitle: model.nativeTitle || ""
                 year: model.year
                 qualityType: model.qualityType || ""
                 posterPath: model.posterPath || ""
                 hasPoster: model.hasPoster || false
-                selected: gridRoot.isSelected(index)
+                selected: gridRoot.isSelected(model.itemId)
                 onClicked: (modifiers) => gridRoot.itemClicked(index, modifiers)
                 onDoubleClicked: gridRoot.itemDoubleClicked(index)
                 onRightClicked: (mx, my) => gridRoot.itemRightClicked(index, mx, my)
@@ -26,12 +26,16 @@ Item {
         var maxY = Math.max(0, listView.contentHeight - listView.height)
         listView.contentY = Math.max(0, Math.min(y, maxY))
     }
-    function isSelected(row) {
-        var id = model.getItemId(row)
-        for (var i = 0; i < selectedIds.length; i++) {
-            if (selectedIds[i] === id) return true
-        }
-        return false
+    // Built once per selection change, so each delegate's check is a
+    // lookup rather than a scan of selectedIds.
+    readonly property var selectedLookup: {
+        var lookup = {}
+        for (var i = 0; i < selectedIds.length; i++) lookup[selectedIds[i]] = true
+        return lookup
+    }
+
+    function isSelected(id) {
+        return selectedLookup[id] === true
     }
 
     ColumnLayout {
@@ -153,6 +157,9 @@ Item {
             clip: true
             boundsBehavior: Flickable.StopAtBounds
             spacing: 1
+            // Rows are pooled and rebound rather than destroyed and recreated,
+            // both while scrolling and when a reload resets the model.
+            reuseItems: true
             ScrollBar.vertical: ScrollBar {
                 policy: ScrollBar.AlwaysOn
             }
@@ -161,7 +168,7 @@ Item {
                 width: listView.width
                 height: tableRoot.rowHeight
 
-                property bool isSelected: tableRoot.isSelected(index)
+                property bool isSelected: tableRoot.isSelected(model.itemId)
 
                 color: isSelected ? _t.accentBg : (rowMouse.containsMouse ? _t.surfaceCardHover : (index % 2 === 0 ? _t.surfaceDark : _t.surface))
                 border.width: isSelected ? 1 : 0
@@ -187,6 +194,7 @@ Item {
                             fillMode: Image.PreserveAspectCrop
                             visible: model.hasPoster || false
                             asynchronous: true
+                            sourceSize.height: parent.height * Screen.devicePixelRatio
                         }
                     }
 
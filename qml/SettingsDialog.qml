@@ -55,8 +55,8 @@ Window {
         if (raw === "") {
             qualityTypes = []
         } else {
-            var arr = raw.split("\n").map(function(s) { return s.trim() }).filter(function(s) { return s !== "" })
-            qualityTypes = sortedQualityTypes(arr)
+            // Stored sorted and trimmed by the backend.
+            qualityTypes = raw.split("\n").filter(function(s) { return s !== "" })
         }
     }
 
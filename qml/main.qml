@@ -90,18 +90,22 @@ ApplicationWindow {
     // ---- Backend Objects ----
     AppController {
         id: controller
-        onItemsChanged: {
-            mediaModel.reload(activePage, activeStatus, searchTerm, controller.sort_field, controller.sort_dir)
-            if (preserveScrollOnNextReload) {
-                Qt.callLater(restoreScrollPosition)
-            }
+        // Deferred to the end of the event loop pass, so several changes
+        // landing together (e.g. queued writes finishing back to back, or a
+        // sort change plus its reload) cost one model reset.
+        onItemsChanged: Qt.callLater(reloadMediaModel)
+        onItemsRemoved: (ids) => {
+            // The view keeps its place when rows are removed in place, so
+            // the position captured before the change isn't needed.
+            mediaModel.removeItems(ids)
+            preserveScrollOnNextReload = false
         }
         onSearchResultsReady: {
             searchModel.loadFromState()
-            if (editDialog.visible) editDialog.onSearchDone()
+            if (editDialogOpen()) editLoader.item.onSearchDone()
         }
         onSearchingChanged: (searching) => {
-            if (editDialog.visible) editDialog.searching = searching
+            if (editDialogOpen()) editLoader.item.searching = searching
         }
         onToastMessage: (message, type_) => toast.show(message, type_)
         onCountsChanged: {} // counts are properties, auto-update
@@ -189,6 +193,7 @@ ApplicationWindow {
                                 captureScrollPosition()
                                 activePage = modelData.page
                                 activeStatus = "On Drive"
+                                searchDebounce.stop()
                                 searchTerm = ""
                                 selectedIds = []
                                 lastClickedRow = -1
@@ -220,7 +225,10 @@ ApplicationWindow {
                         anchors.fill: parent
                         hoverEnabled: true
                         cursorShape: Qt.PointingHandCursor
-                        onClicked: settingsDialog.show()
+                        onClicked: {
+                            settingsLoader.active = true
+                            settingsLoader.item.show()
+                        }
                     }
                 }
             }
@@ -289,9 +297,37 @@ ApplicationWindow {
                             color: _t.textPrimary
                             font.pixelSize: 13
                             background: null
+                            // Trimmed text as typed. searchTerm only follows
+                            // it once the debounce fires, together with the
+                            // controller, so list and counts agree meanwhile.
+                            property string typedTerm: ""
                             onTextChanged: {
-                                searchTerm = text
-                                controller.setSearchTerm(text)
+                                // Leading/trailing spaces don't change the
+                                // results, so typing the space between words
+                                // doesn't re-run the query.
+                                var term = text.trim()
+                                if (term === typedTerm) return
+                                typedTerm = term
+                                // Clearing applies at once; while typing,
+                                // wait for a pause so each keystroke doesn't
+                                // run its own query and list reset.
+                                if (term === "") {
+                                    searchDebounce.stop()
+                                    applySearchTerm()
+                                } else {
+                                    searchDebounce.restart()
+                                }
+                            }
+
+                            function applySearchTerm() {
+                                searchTerm = typedTerm
+                                controller.setSearchTerm(searchTerm)
+                            }
+
+                            Timer {
+                                id: searchDebounce
+                                interval: 200
+                                onTriggered: searchInput.applySearchTerm()
                             }
                         }
                     }
@@ -337,7 +373,7 @@ ApplicationWindow {
                         }
                         MouseArea {
                             id: addMouse; anchors.fill: parent; hoverEnabled: true; cursorShape: Qt.PointingHandCursor
-                            onClicked: editDialog.openAdd()
+                            onClicked: editDialog().openAdd()
                         }
                     }
                 }
@@ -641,26 +677,43 @@ ApplicationWindow {
     }
 
     // ---- Edit Dialog (real OS window) ----
-    EditDialog {
-        id: editDialog
-        controller: controller
-        searchModel: searchModel
-        mediaModel: mediaModel
-        activePage: root.activePage
-        activeStatus: root.activeStatus
-        onAboutToSave: captureScrollPosition()
+    // Created on first use (see editDialog()) so it doesn't add to startup time.
+    Loader {
+        id: editLoader
+        active: false
+        sourceComponent: EditDialog {
+            controller: controller
+            searchModel: searchModel
+            mediaModel: mediaModel
+            activePage: root.activePage
+            activeStatus: root.activeStatus
+            onAboutToSave: captureScrollPosition()
+        }
     }
 
     // ---- Settings Dialog (real OS window) ----
-    SettingsDialog {
-        id: settingsDialog
-        controller: controller
+    // Created on first use so it doesn't add to startup time.
+    Loader {
+        id: settingsLoader
+        active: false
+        sourceComponent: SettingsDialog {
+            controller: controller
+        }
     }
 
     // ---- Toast ----
     Toast { id: toast }
 
     // ---- Helper Functions ----
+    function editDialog() {
+        editLoader.active = true
+        return editLoader.item
+    }
+
+    function editDialogOpen() {
+        return editLoader.item !== null && editLoader.item.visible
+    }
+
     function statusCountFor(statusName) {
         if (statusName === "On Drive") return controller.on_drive_count
         if (statusName === "To Download") return controller.to_download_count
@@ -684,6 +737,13 @@ ApplicationWindow {
         }
     }
 
+    function reloadMediaModel() {
+        mediaModel.reload(activePage, activeStatus, searchTerm, controller.sort_field, controller.sort_dir)
+        if (preserveScrollOnNextReload) {
+            Qt.callLater(restoreScrollPosition)
+        }
+    }
+
     function captureScrollPosition() {
         var key = contextKey(activePage, activeStatus, viewMode)
         var saved = Object.assign({}, savedScrollByContext)
@@ -738,7 +798,7 @@ ApplicationWindow {
     }
 
     function handleItemDoubleClick(row) {
-        editDialog.openEdit(row)
+        editDialog().openEdit(row)
     }
 
     function showContextMenu(row, mx, my) {
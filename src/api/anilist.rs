@@ -1,35 +1,110 @@
+use super::cache;
 use crate::models::SearchResult;
 use reqwest::Client;
+use serde::Deserialize;
 use serde_json::{json, Value};
+use std::collections::hash_map::RandomState;
+use std::hash::{BuildHasher, Hasher};
+use std::time::Duration;
 
 const ANILIST_URL: &str = "https://graphql.anilist.co";
 const MAX_RETRIES: u32 = 3;
+/// Results requested per search. Sent as a variable so the document stays the same.
+const SEARCH_PAGE_SIZE: i32 = 50;
 
-fn strip_html_tags(s: &str) -> String {
-    let mut result = String::new();
-    let mut in_tag = false;
-    for ch in s.chars() {
-        match ch {
-            '<' => in_tag = true,
-            '>' => in_tag = false,
-            _ if !in_tag => result.push(ch),
-            _ => {}
-        }
-    }
-    result
+/// Selection set shared by every media node we request.
+macro_rules! media_fields {
+    () => {
+        r#"
+                        id
+                        title {
+                            english
+                            romaji
+                            native
+                        }
+                        seasonYear
+                        coverImage {
+                            large
+                            medium
+                        }"#
+    };
 }
 
-fn resolve_title(title: &Value) -> (String, Option<String>, Option<String>) {
-    let english = title["english"].as_str().map(|s| s.to_string());
-    let romaji = title["romaji"].as_str().map(|s| s.to_string());
-    let native = title["native"].as_str().map(|s| s.to_string());
+// One document for every search; only the variables change. Unset
+// variables (e.g. `$isAdult` when adult titles are allowed) drop the filter.
+const SEARCH_QUERY: &str = concat!(
+    r#"
+            query ($search: String, $seasonYear: Int, $isAdult: Boolean, $perPage: Int) {
+                Page(page: 1, perPage: $perPage) {
+                    media(search: $search, seasonYear: $seasonYear, type: ANIME, sort: SEARCH_MATCH, isAdult: $isAdult) {"#,
+    media_fields!(),
+    r#"
+                    }
+                }
+            }
+        "#
+);
 
-    let display_title = english
-        .clone()
-        .or_else(|| romaji.clone())
-        .unwrap_or_default();
+// Typed view of the search response. Deserializing from the owned `Value`
+// moves its strings into `SearchResult` instead of copying them.
+#[derive(Deserialize)]
+struct SearchResponse {
+    data: Option<SearchData>,
+}
 
-    (display_title, native, romaji)
+#[derive(Deserialize)]
+struct SearchData {
+    #[serde(rename = "Page")]
+    page: Option<MediaPage>,
+}
+
+#[derive(Deserialize)]
+struct MediaPage {
+    #[serde(default)]
+    media: Vec<Media>,
+}
+
+#[derive(Deserialize)]
+#[serde(rename_all = "camelCase")]
+struct Media {
+    id: i64,
+    title: Option<MediaTitle>,
+    season_year: Option<i32>,
+    cover_image: Option<CoverImage>,
+}
+
+#[derive(Default, Deserialize)]
+struct MediaTitle {
+    english: Option<String>,
+    romaji: Option<String>,
+    native: Option<String>,
+}
+
+#[derive(Deserialize)]
+struct CoverImage {
+    large: Option<String>,
+    medium: Option<String>,
+}
+
+impl From<Media> for SearchResult {
+    fn from(m: Media) -> Self {
+        let MediaTitle { english, romaji, native } = m.title.unwrap_or_default();
+        let title = english.or_else(|| romaji.clone()).unwrap_or_default();
+        let (poster_url, thumbnail_url) =
+            m.cover_image.map(|c| (c.large, c.medium)).unwrap_or_default();
+        SearchResult {
+            api_id: m.id,
+            title,
+            native_title: native,
+            romaji_title: romaji,
+            year: m.season_year,
+            // Descriptions aren't shown in search results, so they're not
+            // requested (they're the largest field in the response).
+            overview: None,
+            poster_url,
+            thumbnail_url,
+        }
+    }
 }
 
 async fn make_request(
@@ -37,22 +112,49 @@ async fn make_request(
     query: &str,
     variables: &Value,
 ) -> Result<Value, String> {
+    // Serialize the body once: it doubles as the cache key and is reused
+    // as-is on every retry.
     let body = json!({
         "query": query,
         "variables": variables,
-    });
+    })
+    .to_string();
+
+    let cache_key = cache::key(&[ANILIST_URL, &body]);
+    cache::shared()
+        .get_or_fetch(cache_key, cache::SEARCH_TTL, || send_request(client, &body))
+        .await
+}
 
+/// How long to wait before retrying a rate-limited request. Honors the
+/// server's Retry-After header, falling back to 5s, 10s, 20s, plus up to 25%
+/// jitter so concurrent retries don't all land in the same window.
+fn retry_delay(resp: &reqwest::Response, retry: u32) -> Duration {
+    let base = resp
+        .headers()
+        .get(reqwest::header::RETRY_AFTER)
+        .and_then(|v| v.to_str().ok())
+        .and_then(|v| v.trim().parse::<u64>().ok())
+        .unwrap_or(5 * (1 << retry));
+    let base = Duration::from_secs(base);
+
+    let random = RandomState::new().build_hasher().finish();
+    let jitter = base.mul_f64((random % 1000) as f64 / 4000.0);
+    base + jitter
+}
+
+async fn send_request(client: &Client, body: &str) -> Result<Value, String> {
     for retry in 0..=MAX_RETRIES {
         let resp = client
             .post(ANILIST_URL)
-            .json(&body)
+            .header(reqwest::header::CONTENT_TYPE, "application/json")
+            .body(body.to_string())
             .send()
             .await
             .map_err(|e| format!("AniList request failed: {}", e))?;
 
         if resp.status().as_u16() == 429 && retry < MAX_RETRIES {
-            let delay = 5 * (1 << retry); // 5s, 10s, 20s
-            tokio::time::sleep(std::time::Duration::from_secs(delay)).await;
+            tokio::time::sleep(retry_delay(&resp, retry)).await;
             continue;
         }
 
@@ -60,12 +162,10 @@ async fn make_request(
             return Err(format!("AniList error: HTTP {}", resp.status()));
         }
 
-        let data: Value = resp
+        return resp
             .json()
             .await
-            .map_err(|e| format!("Failed to parse AniList response: {}", e))?;
-
-        return Ok(data);
+            .map_err(|e| format!("Failed to parse AniList response: {}", e));
     }
 
     Err("AniList: max retries exceeded".into())
@@ -77,76 +177,24 @@ pub async fn search_anime(
     year: Option<i32>,
     include_adult: bool,
 ) -> Result<Vec<SearchResult>, String> {
-    let gql = if !include_adult {
-        r#"
-            query ($search: String, $seasonYear: Int) {
-                Page(page: 1, perPage: 50) {
-                    media(search: $search, seasonYear: $seasonYear, type: ANIME, sort: SEARCH_MATCH, isAdult: false) {
-                        id
-                        title {
-                            english
-                            romaji
-                            native
-                        }
-                        seasonYear
-                        description
-                        coverImage {
-                            large
-                        }
-                    }
-                }
-            }
-        "#
-    } else {
-        r#"
-            query ($search: String, $seasonYear: Int) {
-                Page(page: 1, perPage: 50) {
-                    media(search: $search, seasonYear: $seasonYear, type: ANIME, sort: SEARCH_MATCH) {
-                        id
-                        title {
-                            english
-                            romaji
-                            native
-                        }
-                        seasonYear
-                        description
-                        coverImage {
-                            large
-                        }
-                    }
-                }
-            }
-        "#
-    };
-
-    let mut variables = json!({ "search": query });
+    let mut variables = json!({ "search": query, "perPage": SEARCH_PAGE_SIZE });
     if let Some(y) = year {
         variables["seasonYear"] = json!(y);
     }
+    if !include_adult {
+        variables["isAdult"] = json!(false);
+    }
 
-    let data = make_request(client, gql, &variables).await?;
-
-    let results = data["data"]["Page"]["media"]
-        .as_array()
-        .unwrap_or(&vec![])
-        .iter()
-        .map(|m| {
-            let (title, native_title, romaji_title) = resolve_title(&m["title"]);
-            SearchResult {
-                api_id: m["id"].as_i64().unwrap_or(0),
-                title,
-                native_title,
-                romaji_title,
-                year: m["seasonYear"].as_i64().map(|y| y as i32),
-                overview: m["description"]
-                    .as_str()
-                    .map(|d| strip_html_tags(d)),
-                poster_url: m["coverImage"]["large"]
-                    .as_str()
-                    .map(|s| s.to_string()),
-            }
-        })
-        .collect();
+    let data = make_request(client, SEARCH_QUERY, &variables).await?;
+
+    let response: SearchResponse = serde_json::from_value(data)
+        .map_err(|e| format!("Failed to parse AniList response: {}", e))?;
+
+    let results = response
+        .data
+        .and_then(|d| d.page)
+        .map(|p| p.media.into_iter().map(SearchResult::from).collect())
+        .unwrap_or_default();
 
     Ok(results)
 }
@@ -0,0 +1,277 @@
+use serde_json::Value;
+use sha2::{Digest, Sha256};
+use std::collections::HashMap;
+use std::future::Future;
+use std::path::{Path, PathBuf};
+use std::sync::atomic::{AtomicU64, Ordering};
+use std::sync::{Arc, Mutex, OnceLock};
+use std::time::{Duration, Instant, SystemTime};
+
+/// How long a search response is served from cache before re-fetching.
+pub const SEARCH_TTL: Duration = Duration::from_secs(600);
+const MAX_ENTRIES: usize = 512;
+
+/// Responses persisted to disk stay valid across restarts for this long.
+const DISK_TTL: Duration = Duration::from_secs(86_400);
+const DISK_MAX_BYTES: u64 = 20 * 1024 * 1024;
+/// The directory is pruned at startup and then after this many writes,
+/// rather than scanned on every insert.
+const DISK_PRUNE_INTERVAL: u64 = 64;
+
+struct Entry {
+    expires_at: Instant,
+    last_used: u64,
+    value: Value,
+}
+
+#[derive(Default)]
+struct Inner {
+    entries: HashMap<String, Entry>,
+    tick: u64,
+}
+
+type InFlight = Arc<tokio::sync::OnceCell<Result<Value, String>>>;
+
+/// TTL + LRU cache of API responses, keyed by a hash of the request.
+///
+/// Entries are kept in memory and, once a directory has been set with
+/// `set_disk_dir`, also written to disk so they survive restarts. Disk
+/// access runs on the runtime's blocking pool, off the async workers.
+pub struct ResponseCache {
+    capacity: usize,
+    inner: Mutex<Inner>,
+    disk_dir: OnceLock<PathBuf>,
+    disk_writes: AtomicU64,
+    inflight: Mutex<HashMap<String, InFlight>>,
+}
+
+impl ResponseCache {
+    /// A capacity of 0 disables caching entirely.
+    pub fn new(capacity: usize) -> Self {
+        Self {
+            capacity,
+            inner: Mutex::new(Inner::default()),
+            disk_dir: OnceLock::new(),
+            disk_writes: AtomicU64::new(0),
+            inflight: Mutex::new(HashMap::new()),
+        }
+    }
+
+    pub fn set_disk_dir(&self, dir: PathBuf) {
+        if std::fs::create_dir_all(&dir).is_ok() && self.disk_dir.set(dir.clone()).is_ok() {
+            super::runtime().spawn_blocking(move || prune_disk(&dir));
+        }
+    }
+
+    pub async fn get(&self, key: &str) -> Option<Value> {
+        if self.capacity == 0 {
+            return None;
+        }
+        if let Some(value) = self.get_memory(key) {
+            return Some(value);
+        }
+
+        // Fall back to the on-disk copy and promote it into memory.
+        let dir = self.disk_dir.get()?.clone();
+        let disk_key = key.to_string();
+        let value = super::runtime()
+            .spawn_blocking(move || read_disk(&dir, &disk_key))
+            .await
+            .ok()??;
+        self.insert_memory(key.to_string(), value.clone(), SEARCH_TTL);
+        Some(value)
+    }
+
+    fn get_memory(&self, key: &str) -> Option<Value> {
+        let mut guard = self.inner.lock().unwrap();
+        let inner = &mut *guard;
+        inner.tick += 1;
+
+        let expired = match inner.entries.get_mut(key) {
+            Some(entry) if entry.expires_at > Instant::now() => {
+                entry.last_used = inner.tick;
+                return Some(entry.value.clone());
+            }
+            Some(_) => true,
+            None => false,
+        };
+        if expired {
+            inner.entries.remove(key);
+        }
+        None
+    }
+
+    pub fn insert(&self, key: String, value: Value, ttl: Duration) {
+        if self.capacity == 0 {
+            return;
+        }
+        self.write_disk(&key, &value);
+        self.insert_memory(key, value, ttl);
+    }
+
+    /// Return the cached response for `key`, or run `fetch` to produce it.
+    ///
+    /// Concurrent callers with the same key share a single fetch: the first
+    /// one runs it and the rest await its result instead of issuing their own
+    /// request. Only successful responses are cached.
+    pub async fn get_or_fetch<F, Fut>(
+        &self,
+        key: String,
+        ttl: Duration,
+        fetch: F,
+    ) -> Result<Value, String>
+    where
+        F: FnOnce() -> Fut,
+        Fut: Future<Output = Result<Value, String>>,
+    {
+        if let Some(value) = self.get(&key).await {
+            return Ok(value);
+        }
+
+        let cell = self
+            .inflight
+            .lock()
+            .unwrap()
+            .entry(key.clone())
+            .or_default()
+            .clone();
+
+        let result = cell
+            .get_or_init(|| async {
+                // A fetch that finished just before we joined may already
+                // have filled the cache.
+                if let Some(value) = self.get_memory(&key) {
+                    return Ok(value);
+                }
+                let result = fetch().await;
+                if let Ok(value) = &result {
+                    self.insert(key.clone(), value.clone(), ttl);
+                }
+                result
+            })
+            .await
+            .clone();
+
+        let mut inflight = self.inflight.lock().unwrap();
+        if inflight.get(&key).is_some_and(|c| Arc::ptr_eq(c, &cell)) {
+            inflight.remove(&key);
+        }
+        result
+    }
+
+    fn insert_memory(&self, key: String, value: Value, ttl: Duration) {
+        let mut guard = self.inner.lock().unwrap();
+        let inner = &mut *guard;
+        let now = Instant::now();
+
+        // Drop stale entries opportunistically, then evict the least recently
+        // used one if we're still full.
+        inner.entries.retain(|_, e| e.expires_at > now);
+        if inner.entries.len() >= self.capacity && !inner.entries.contains_key(&key) {
+            let oldest = inner
+                .entries
+                .iter()
+                .min_by_key(|(_, e)| e.last_used)
+                .map(|(k, _)| k.clone());
+            if let Some(oldest) = oldest {
+                inner.entries.remove(&oldest);
+            }
+        }
+
+        inner.tick += 1;
+        inner.entries.insert(
+            key,
+            Entry {
+                expires_at: now + ttl,
+                last_used: inner.tick,
+                value,
+            },
+        );
+    }
+
+    fn write_disk(&self, key: &str, value: &Value) {
+        let Some(dir) = self.disk_dir.get() else {
+            return;
+        };
+        let Ok(data) = serde_json::to_vec(value) else {
+            return;
+        };
+        let dir = dir.clone();
+        let key = key.to_string();
+        let n = self.disk_writes.fetch_add(1, Ordering::Relaxed) + 1;
+        super::runtime().spawn_blocking(move || {
+            // Written under a unique temporary name and renamed into place,
+            // so readers see either the old file or the complete new one.
+            let tmp = dir.join(format!("{}.{}.tmp", key, n));
+            if std::fs::write(&tmp, data).is_err()
+                || std::fs::rename(&tmp, dir.join(format!("{}.json", key))).is_err()
+            {
+                let _ = std::fs::remove_file(&tmp);
+            }
+            if n % DISK_PRUNE_INTERVAL == 0 {
+                prune_disk(&dir);
+            }
+        });
+    }
+}
+
+/// Process-wide cache shared by the AniList and TMDB clients.
+pub fn shared() -> &'static ResponseCache {
+    static CACHE: OnceLock<ResponseCache> = OnceLock::new();
+    CACHE.get_or_init(|| ResponseCache::new(MAX_ENTRIES))
+}
+
+/// Build a cache key from the parts that identify a request.
+pub fn key(parts: &[&str]) -> String {
+    let mut hasher = Sha256::new();
+    for part in parts {
+        hasher.update(part.as_bytes());
+        hasher.update([0]);
+    }
+    hex::encode(hasher.finalize())
+}
+
+fn read_disk(dir: &Path, key: &str) -> Option<Value> {
+    let path = dir.join(format!("{}.json", key));
+    let modified = std::fs::metadata(&path).and_then(|m| m.modified()).ok()?;
+    let age = SystemTime::now().duration_since(modified).unwrap_or_default();
+    if age > DISK_TTL {
+        let _ = std::fs::remove_file(&path);
+        return None;
+    }
+    let data = std::fs::read(&path).ok()?;
+    serde_json::from_slice(&data).ok()
+}
+
+/// Remove expired files, then the oldest ones until the directory fits
+/// within `DISK_MAX_BYTES`.
+fn prune_disk(dir: &Path) {
+    let Ok(read_dir) = std::fs::read_dir(dir) else {
+        return;
+    };
+    let now = SystemTime::now();
+    let mut files: Vec<(SystemTime, u64, PathBuf)> = Vec::new();
+    for entry in read_dir.flatten() {
+        let Ok(meta) = entry.metadata() else { continue };
+        let modified = meta.modified().unwrap_or(now);
+        if now.duration_since(modified).unwrap_or_default() > DISK_TTL {
+            let _ = std::fs::remove_file(entry.path());
+        } else {
+            files.push((modified, meta.len(), entry.path()));
+        }
+    }
+
+    let mut total: u64 = files.iter().map(|(_, len, _)| len).sum();
+    if total <= DISK_MAX_BYTES {
+        return;
+    }
+    files.sort_by_key(|(modified, _, _)| *modified);
+    for (_, len, path) in files {
+        if total <= DISK_MAX_BYTES {
+            break;
+        }
+        if std::fs::remove_file(&path).is_ok() {
+            total -= len;
+        }
+    }
+}
@@ -1,2 +1,36 @@
 pub mod anilist;
+pub mod cache;
 pub mod tmdb;
+
+use reqwest::Client;
+use std::sync::OnceLock;
+use std::time::Duration;
+
+/// Shared HTTP client. Searches and poster downloads reuse its pooled
+/// keep-alive connections instead of paying a TCP/TLS handshake per call.
+pub fn http_client() -> &'static Client {
+    static CLIENT: OnceLock<Client> = OnceLock::new();
+    CLIENT.get_or_init(|| {
+        Client::builder()
+            .timeout(Duration::from_secs(15))
+            .pool_idle_timeout(Duration::from_secs(90))
+            .pool_max_idle_per_host(8)
+            .tcp_keepalive(Duration::from_secs(60))
+            .build()
+            .unwrap_or_default()
+    })
+}
+
+/// Shared async runtime for background network work. Pooled connections are
+/// driven by tasks on this runtime, so it must outlive individual requests.
+pub fn runtime() -> &'static tokio::runtime::Runtime {
+    static RUNTIME: OnceLock<tokio::runtime::Runtime> = OnceLock::new();
+    RUNTIME.get_or_init(|| {
+        tokio::runtime::Builder::new_multi_thread()
+            .worker_threads(2)
+            .thread_name("media-tracker-net")
+            .enable_all()
+            .build()
+            .expect("Failed to start async runtime")
+    })
+}
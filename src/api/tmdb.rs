@@ -1,9 +1,12 @@
+use super::cache;
 use crate::models::SearchResult;
 use reqwest::Client;
 use serde_json::Value;
 
 const BASE_URL: &str = "https://api.themoviedb.org/3";
 const IMAGE_BASE_URL: &str = "https://image.tmdb.org/t/p/w500";
+/// Smallest poster size TMDB serves, for result list thumbnails.
+const THUMBNAIL_BASE_URL: &str = "https://image.tmdb.org/t/p/w92";
 
 fn extract_year(date_str: &str) -> Option<i32> {
     if date_str.len() >= 4 {
@@ -17,6 +20,10 @@ fn poster_url(path: Option<&str>) -> Option<String> {
     path.map(|p| format!("{}{}", IMAGE_BASE_URL, p))
 }
 
+fn thumbnail_url(path: Option<&str>) -> Option<String> {
+    path.map(|p| format!("{}{}", THUMBNAIL_BASE_URL, p))
+}
+
 fn parse_movie_results(data: &Value) -> Vec<SearchResult> {
     data["results"]
         .as_array()
@@ -30,6 +37,7 @@ fn parse_movie_results(data: &Value) -> Vec<SearchResult> {
             year: r["release_date"].as_str().and_then(|d| extract_year(d)),
             overview: r["overview"].as_str().map(|s| s.to_string()),
             poster_url: poster_url(r["poster_path"].as_str()),
+            thumbnail_url: thumbnail_url(r["poster_path"].as_str()),
         })
         .collect()
 }
@@ -47,35 +55,75 @@ fn parse_tv_results(data: &Value) -> Vec<SearchResult> {
             year: r["first_air_date"].as_str().and_then(|d| extract_year(d)),
             overview: r["overview"].as_str().map(|s| s.to_string()),
             poster_url: poster_url(r["poster_path"].as_str()),
+            thumbnail_url: thumbnail_url(r["poster_path"].as_str()),
         })
         .collect()
 }
 
+/// Fetch one page of search results. The API key and page number are sent
+/// alongside `params` so both pages of a search share the same parameters.
 async fn tmdb_search(
     client: &Client,
+    api_key: &str,
     endpoint: &str,
     params: &[(&str, String)],
+    page: u32,
 ) -> Result<(Value, i64), String> {
-    let resp = client
-        .get(&format!("{}/{}", BASE_URL, endpoint))
-        .query(params)
-        .send()
-        .await
-        .map_err(|e| format!("TMDB request failed: {}", e))?;
-
-    if !resp.status().is_success() {
-        return Err(format!("TMDB error: HTTP {}", resp.status()));
-    }
+    let page = page.to_string();
 
-    let data: Value = resp
-        .json()
-        .await
-        .map_err(|e| format!("Failed to parse TMDB response: {}", e))?;
+    // The API key doesn't change the response, so keep it out of the key.
+    let mut key_parts = vec![endpoint, &page];
+    for (name, value) in params {
+        key_parts.push(name);
+        key_parts.push(value);
+    }
+    let cache_key = cache::key(&key_parts);
+
+    let data = cache::shared()
+        .get_or_fetch(cache_key, cache::SEARCH_TTL, || async {
+            let resp = client
+                .get(&format!("{}/{}", BASE_URL, endpoint))
+                .header(reqwest::header::ACCEPT, "application/json")
+                .query(&[("api_key", api_key), ("page", &page)])
+                .query(params)
+                .send()
+                .await
+                .map_err(|e| format!("TMDB request failed: {}", e))?;
+
+            if !resp.status().is_success() {
+                return Err(format!("TMDB error: HTTP {}", resp.status()));
+            }
+
+            resp.json::<Value>()
+                .await
+                .map_err(|e| format!("Failed to parse TMDB response: {}", e))
+        })
+        .await?;
 
     let total_pages = data["total_pages"].as_i64().unwrap_or(1);
     Ok((data, total_pages))
 }
 
+/// Fetch page 1, then page 2 only when page 1 reports more than one page,
+/// so single-page searches cost one request.
+async fn search_first_pages(
+    client: &Client,
+    api_key: &str,
+    endpoint: &str,
+    params: &[(&str, String)],
+    parse: fn(&Value) -> Vec<SearchResult>,
+) -> Result<Vec<SearchResult>, String> {
+    let (data1, total_pages) = tmdb_search(client, api_key, endpoint, params, 1).await?;
+    let mut results = parse(&data1);
+    if total_pages > 1 {
+        if let Ok((data2, _)) = tmdb_search(client, api_key, endpoint, params, 2).await {
+            results.extend(parse(&data2));
+        }
+    }
+
+    Ok(results)
+}
+
 pub async fn search_movie(
     client: &Client,
     api_key: &str,
@@ -83,33 +131,16 @@ pub async fn search_movie(
     year: Option<i32>,
     include_adult: bool,
 ) -> Result<Vec<SearchResult>, String> {
-    let mut base_params = vec![
-        ("api_key", api_key.to_string()),
+    let mut params = vec![
         ("query", query.to_string()),
         ("language", "en-US".to_string()),
         ("include_adult", include_adult.to_string()),
-        ("page", "1".to_string()),
     ];
     if let Some(y) = year {
-        base_params.push(("year", y.to_string()));
-    }
-
-    // Fetch page 1
-    let (data1, total_pages) = tmdb_search(client, "search/movie", &base_params).await?;
-    let mut results = parse_movie_results(&data1);
-
-    // Fetch page 2 if available
-    if total_pages > 1 {
-        let mut params2 = base_params.clone();
-        for p in params2.iter_mut() {
-            if p.0 == "page" { p.1 = "2".to_string(); }
-        }
-        if let Ok((data2, _)) = tmdb_search(client, "search/movie", &params2).await {
-            results.extend(parse_movie_results(&data2));
-        }
+        params.push(("year", y.to_string()));
     }
 
-    Ok(results)
+    search_first_pages(client, api_key, "search/movie", &params, parse_movie_results).await
 }
 
 pub async fn search_tv(
@@ -119,31 +150,14 @@ pub async fn search_tv(
     year: Option<i32>,
     include_adult: bool,
 ) -> Result<Vec<SearchResult>, String> {
-    let mut base_params = vec![
-        ("api_key", api_key.to_string()),
+    let mut params = vec![
         ("query", query.to_string()),
         ("language", "en-US".to_string()),
         ("include_adult", include_adult.to_string()),
-        ("page", "1".to_string()),
     ];
     if let Some(y) = year {
-        base_params.push(("first_air_date_year", y.to_string()));
-    }
-
-    // Fetch page 1
-    let (data1, total_pages) = tmdb_search(client, "search/tv", &base_params).await?;
-    let mut results = parse_tv_results(&data1);
-
-    // Fetch page 2 if available
-    if total_pages > 1 {
-        let mut params2 = base_params.clone();
-        for p in params2.iter_mut() {
-            if p.0 == "page" { p.1 = "2".to_string(); }
-        }
-        if let Ok((data2, _)) = tmdb_search(client, "search/tv", &params2).await {
-            results.extend(parse_tv_results(&data2));
-        }
+        params.push(("first_air_date_year", y.to_string()));
     }
 
-    Ok(results)
+    search_first_pages(client, api_key, "search/tv", &params, parse_tv_results).await
 }
@@ -110,6 +110,10 @@ pub mod qobject {
         #[cxx_name = "itemsChanged"]
         fn items_changed(self: Pin<&mut Self>);
 
+        #[qsignal]
+        #[cxx_name = "itemsRemoved"]
+        fn items_removed(self: Pin<&mut Self>, ids: QString);
+
         #[qsignal]
         #[cxx_name = "searchResultsReady"]
         fn search_results_ready(self: Pin<&mut Self>);
@@ -139,7 +143,8 @@ use core::pin::Pin;
 use cxx_qt::Threading;
 use cxx_qt_lib::QString;
 use std::path::PathBuf;
-use std::sync::{Arc, Mutex};
+use std::sync::atomic::{AtomicU64, Ordering};
+use std::sync::{mpsc, Arc, Mutex, OnceLock};
 
 use crate::api;
 use crate::config;
@@ -149,11 +154,19 @@ use crate::models::{AppConfig, MediaItem, SearchResult};
 
 /// Shared app state accessible from the bridge
 pub struct AppState {
+    /// Read-write connection, used by the database writer thread.
     pub db: Mutex<rusqlite::Connection>,
+    /// Read-only connection for list and count queries on the GUI thread,
+    /// so reads never queue behind the writer.
+    pub read_db: Mutex<rusqlite::Connection>,
     pub config: Mutex<AppConfig>,
     pub config_path: PathBuf,
     pub data_dir: PathBuf,
-    pub search_results: Mutex<Vec<SearchResult>>,
+    /// Latest search results, shared with SearchModel without copying.
+    pub search_results: Mutex<Arc<Vec<SearchResult>>>,
+    /// Bumped by every online search; a search whose number is no longer
+    /// current when it finishes has been superseded and its results dropped.
+    pub search_generation: AtomicU64,
 }
 
 /// Global app state, initialized once
@@ -162,20 +175,57 @@ static APP_STATE: std::sync::OnceLock<Arc<AppState>> = std::sync::OnceLock::new(
 pub fn init_app_state() -> Arc<AppState> {
     let data_dir = get_data_dir();
     let conn = db::connection::init_db(&data_dir).expect("Failed to initialize database");
+    let read_conn = db::connection::open_reader(&data_dir).expect("Failed to open database for reading");
     let (cfg, config_path) = config::manager::load_config(&data_dir).expect("Failed to load config");
+    api::cache::shared().set_disk_dir(data_dir.join("api_cache"));
 
     let state = Arc::new(AppState {
         db: Mutex::new(conn),
+        read_db: Mutex::new(read_conn),
         config: Mutex::new(cfg),
         config_path,
         data_dir,
-        search_results: Mutex::new(Vec::new()),
+        search_results: Mutex::new(Arc::new(Vec::new())),
+        search_generation: AtomicU64::new(0),
     });
 
     APP_STATE.set(state.clone()).ok();
     state
 }
 
+/// Called once the Qt event loop has exited. Queued writes are allowed to
+/// finish before the connection is closed.
+pub fn shutdown_app_state() {
+    let (done_tx, done_rx) = mpsc::channel();
+    queue_db_write(move |conn| {
+        db::connection::close_db(conn);
+        let _ = done_tx.send(());
+    });
+    let _ = done_rx.recv();
+}
+
+type DbWrite = Box<dyn FnOnce(&rusqlite::Connection) + Send>;
+
+/// Hand a write to the database writer thread. Writes run one at a time in
+/// the order they were queued, so the GUI thread never waits on SQLite.
+fn queue_db_write(write: impl FnOnce(&rusqlite::Connection) + Send + 'static) {
+    static WRITER: OnceLock<mpsc::Sender<DbWrite>> = OnceLock::new();
+    let writer = WRITER.get_or_init(|| {
+        let (tx, rx) = mpsc::channel::<DbWrite>();
+        std::thread::Builder::new()
+            .name("media-tracker-db".into())
+            .spawn(move || {
+                let state = get_app_state();
+                for write in rx {
+                    write(&state.db.lock().unwrap());
+                }
+            })
+            .expect("Failed to start database writer thread");
+        tx
+    });
+    let _ = writer.send(Box::new(write));
+}
+
 pub fn get_app_state() -> Arc<AppState> {
     APP_STATE.get().expect("App state not initialized").clone()
 }
@@ -213,8 +263,7 @@ impl qobject::AppController {
         self.as_mut().set_active_page(page.clone());
         self.as_mut().set_active_status(QString::from("On Drive"));
         self.as_mut().set_search_term(QString::from(""));
-        self.as_mut().reload_items();
-        self.as_mut().reload_counts();
+        self.as_mut().reload_all();
     }
 
     pub fn set_status_filter(mut self: Pin<&mut Self>, status: &QString) {
@@ -249,11 +298,14 @@ impl qobject::AppController {
         poster_url: &QString,
     ) {
         let state = get_app_state();
-        let conn = state.db.lock().unwrap();
         let media_type = self.active_page().to_string();
 
         let normalized_poster_url = opt_string(poster_url)
             .map(|url| normalize_poster_url_for_storage(&url, &state.data_dir));
+        // An edit that changes the status moves the item out of the tab it
+        // was opened from; the rest of the list is unaffected.
+        let view = self.current_view();
+        let moved_out = id >= 0 && status.to_string() != view.1;
 
         let item = MediaItem {
             id: if id >= 0 { Some(id as i64) } else { None },
@@ -273,27 +325,32 @@ impl qobject::AppController {
             updated_at: None,
         };
 
-        let result = if id >= 0 {
-            db::queries::update_item(&conn, &item).map(|_| "Item updated".to_string())
-        } else {
-            db::queries::add_item(&conn, &item).map(|_| "Item added".to_string())
-        };
-
-        drop(conn);
-
-        match result {
-            Ok(msg) => {
-                self.as_mut().toast_message(QString::from(&msg), QString::from("success"));
-                self.as_mut().reload_items();
-                self.as_mut().reload_counts();
-            }
-            Err(e) => {
-                self.as_mut().toast_message(
-                    QString::from(&format!("Error: {}", e)),
-                    QString::from("error"),
-                );
-            }
-        }
+        self.as_mut().write_db(
+            move |conn| {
+                if id >= 0 {
+                    db::queries::update_item(conn, &item).map(|_| "Item updated")
+                } else {
+                    db::queries::add_item(conn, &item).map(|_| "Item added")
+                }
+            },
+            move |mut ctrl, result| match result {
+                Ok(msg) => {
+                    ctrl.as_mut().toast_message(QString::from(msg), QString::from("success"));
+                    if moved_out && ctrl.current_view() == view {
+                        ctrl.as_mut().refresh_status_counts();
+                        ctrl.as_mut().items_removed(QString::from(&id.to_string()));
+                    } else {
+                        ctrl.as_mut().reload_all();
+                    }
+                }
+                Err(e) => {
+                    ctrl.as_mut().toast_message(
+                        QString::from(&format!("Error: {}", e)),
+                        QString::from("error"),
+                    );
+                }
+            },
+        );
     }
 
     pub fn delete_items(mut self: Pin<&mut Self>, ids: &QString) {
@@ -307,34 +364,48 @@ impl qobject::AppController {
             return;
         }
 
-        let state = get_app_state();
-        let conn = state.db.lock().unwrap();
-
-        // Collect poster paths before deleting so we can clean up cached images
-        let poster_paths = db::queries::get_poster_urls(&conn, &id_vec).unwrap_or_default();
-
-        match db::queries::delete_items_batch(&conn, &id_vec) {
-            Ok(_) => {
-                drop(conn);
-                for path in &poster_paths {
-                    images::cache::delete_cached_poster(path, &state.data_dir);
+        let data_dir = get_app_state().data_dir.clone();
+        let count = id_vec.len();
+        let removed = ids.to_string();
+        let view = self.current_view();
+
+        self.as_mut().write_db(
+            move |conn| {
+                // Collect poster paths before deleting so we can clean up cached images
+                let poster_paths = db::queries::get_poster_urls(conn, &id_vec).unwrap_or_default();
+                let result = db::queries::delete_items_batch(conn, &id_vec);
+                if result.is_ok() {
+                    for path in &poster_paths {
+                        images::cache::delete_cached_poster(path, &data_dir);
+                    }
                 }
-                let count = id_vec.len();
-                self.as_mut().toast_message(
-                    QString::from(&format!("Deleted {} item(s)", count)),
-                    QString::from("success"),
-                );
-                self.as_mut().reload_items();
-                self.as_mut().reload_counts();
-            }
-            Err(e) => {
-                drop(conn);
-                self.as_mut().toast_message(
-                    QString::from(&format!("Delete failed: {}", e)),
-                    QString::from("error"),
-                );
-            }
-        }
+                result
+            },
+            move |mut ctrl, result| match result {
+                Ok(_) => {
+                    ctrl.as_mut().toast_message(
+                        QString::from(&format!("Deleted {} item(s)", count)),
+                        QString::from("success"),
+                    );
+                    // Drop just those rows; the rest of the list is unchanged.
+                    // If the view changed meanwhile, it was loaded before the
+                    // delete landed and needs a full reload.
+                    if ctrl.current_view() == view {
+                        ctrl.as_mut().refresh_status_counts();
+                        ctrl.as_mut().reload_counts();
+                        ctrl.as_mut().items_removed(QString::from(&removed));
+                    } else {
+                        ctrl.as_mut().reload_all();
+                    }
+                }
+                Err(e) => {
+                    ctrl.as_mut().toast_message(
+                        QString::from(&format!("Delete failed: {}", e)),
+                        QString::from("error"),
+                    );
+                }
+            },
+        );
     }
 
     pub fn move_items(mut self: Pin<&mut Self>, ids: &QString, new_status: &QString) {
@@ -348,29 +419,49 @@ impl qobject::AppController {
             return;
         }
 
-        let state = get_app_state();
-        let conn = state.db.lock().unwrap();
-        match db::queries::move_items(&conn, &id_vec, &new_status.to_string()) {
-            Ok(_) => {
-                drop(conn);
-                self.as_mut().toast_message(
-                    QString::from(&format!("Moved {} item(s)", id_vec.len())),
-                    QString::from("success"),
-                );
-                self.as_mut().reload_items();
-            }
-            Err(e) => {
-                drop(conn);
-                self.as_mut().toast_message(
-                    QString::from(&format!("Move failed: {}", e)),
-                    QString::from("error"),
-                );
-            }
-        }
+        let new_status = new_status.to_string();
+        let count = id_vec.len();
+        let removed = ids.to_string();
+        let view = self.current_view();
+
+        self.as_mut().write_db(
+            move |conn| db::queries::move_items(conn, &id_vec, &new_status),
+            move |mut ctrl, result| match result {
+                Ok(_) => {
+                    ctrl.as_mut().toast_message(
+                        QString::from(&format!("Moved {} item(s)", count)),
+                        QString::from("success"),
+                    );
+                    // Items only move to other tabs, so they leave this one.
+                    // A tab switched to meanwhile (possibly the destination)
+                    // was loaded before the move and needs a full reload.
+                    if ctrl.current_view() == view {
+                        ctrl.as_mut().refresh_status_counts();
+                        ctrl.as_mut().items_removed(QString::from(&removed));
+                    } else {
+                        ctrl.as_mut().reload_all();
+                    }
+                }
+                Err(e) => {
+                    ctrl.as_mut().toast_message(
+                        QString::from(&format!("Move failed: {}", e)),
+                        QString::from("error"),
+                    );
+                }
+            },
+        );
     }
 
     pub fn search_online(mut self: Pin<&mut Self>, query: &QString, year: i32) {
-        let query_str = query.to_string().trim().to_string();
+        // Both APIs match case-insensitively and ignore extra spaces, so
+        // normalize the query: variants like "Star  Wars" and "star wars"
+        // then share one cached response instead of each hitting the API.
+        let query_str = query
+            .to_string()
+            .split_whitespace()
+            .collect::<Vec<_>>()
+            .join(" ")
+            .to_lowercase();
         if query_str.is_empty() {
             return;
         }
@@ -382,69 +473,70 @@ impl qobject::AppController {
             (cfg.tmdb_api_key.clone(), cfg.include_adult)
         };
 
+        let generation = state.search_generation.fetch_add(1, Ordering::SeqCst) + 1;
         self.as_mut().searching_changed(true);
 
         let qt_thread = self.qt_thread();
         let year_opt = if year > 0 { Some(year) } else { None };
 
-        std::thread::spawn(move || {
-            let rt = tokio::runtime::Runtime::new().unwrap();
-            rt.block_on(async {
-                let client = reqwest::Client::builder()
-                    .timeout(std::time::Duration::from_secs(15))
-                    .build()
-                    .unwrap_or_default();
-
-                let results = match media_type.as_str() {
-                    "Movie" => {
-                        if api_key.is_empty() {
-                            Err("TMDB API key not set. Configure in Settings.".to_string())
-                        } else {
-                            api::tmdb::search_movie(&client, &api_key, &query_str, year_opt, include_adult).await
-                        }
-                    }
-                    "TV" => {
-                        if api_key.is_empty() {
-                            Err("TMDB API key not set. Configure in Settings.".to_string())
-                        } else {
-                            api::tmdb::search_tv(&client, &api_key, &query_str, year_opt, include_adult).await
-                        }
-                    }
-                    "Anime" => {
-                        api::anilist::search_anime(&client, &query_str, year_opt, include_adult).await
-                    }
-                    _ => Err("Unknown media type".to_string()),
-                };
+        api::runtime().spawn(async move {
+            let client = api::http_client();
 
-                match results {
-                    Ok(results) => {
-                        let count = results.len();
-
-                        // Store results in global state (posters are NOT cached yet —
-                        // they're only downloaded when the user actually adds items)
-                        let state = get_app_state();
-                        *state.search_results.lock().unwrap() = results;
-
-                        qt_thread.queue(move |mut ctrl: Pin<&mut qobject::AppController>| {
-                            ctrl.as_mut().searching_changed(false);
-                            ctrl.as_mut().toast_message(
-                                QString::from(&format!("Found {} results", count)),
-                                QString::from("success"),
-                            );
-                            ctrl.as_mut().search_results_ready();
-                        }).unwrap();
+            let results = match media_type.as_str() {
+                "Movie" => {
+                    if api_key.is_empty() {
+                        Err("TMDB API key not set. Configure in Settings.".to_string())
+                    } else {
+                        api::tmdb::search_movie(client, &api_key, &query_str, year_opt, include_adult).await
                     }
-                    Err(e) => {
-                        qt_thread.queue(move |mut ctrl: Pin<&mut qobject::AppController>| {
-                            ctrl.as_mut().searching_changed(false);
-                            ctrl.as_mut().toast_message(
-                                QString::from(&format!("Search failed: {}", e)),
-                                QString::from("error"),
-                            );
-                        }).unwrap();
+                }
+                "TV" => {
+                    if api_key.is_empty() {
+                        Err("TMDB API key not set. Configure in Settings.".to_string())
+                    } else {
+                        api::tmdb::search_tv(client, &api_key, &query_str, year_opt, include_adult).await
                     }
                 }
-            });
+                "Anime" => {
+                    api::anilist::search_anime(client, &query_str, year_opt, include_adult).await
+                }
+                _ => Err("Unknown media type".to_string()),
+            };
+
+            // A newer search was started while this one ran; leave the results
+            // and the searching indicator to it.
+            let state = get_app_state();
+            if state.search_generation.load(Ordering::SeqCst) != generation {
+                return;
+            }
+
+            match results {
+                Ok(results) => {
+                    let count = results.len();
+
+                    // Store results in global state (posters are NOT cached yet —
+                    // they're only downloaded when the user actually adds items)
+                    *state.search_results.lock().unwrap() = Arc::new(results);
+
+                    qt_thread.queue(move |mut ctrl: Pin<&mut qobject::AppController>| {
+                        ctrl.as_mut().searching_changed(false);
+                        ctrl.as_mut().toast_message(
+                            QString::from(&format!("Found {} results", count)),
+                            QString::from("success"),
+                        );
+                        ctrl.as_mut().search_results_ready();
+                    }).unwrap();
+                }
+                Err(e) => {
+                    qt_thread.queue(move |mut ctrl: Pin<&mut qobject::AppController>| {
+                        ctrl.as_mut().searching_changed(false);
+                        ctrl.as_mut().toast_message(
+                            QString::from(&format!("Search failed: {}", e)),
+                            QString::from("error"),
+                        );
+                    }).unwrap();
+                }
+            }
         });
     }
 
@@ -460,7 +552,7 @@ impl qobject::AppController {
         }
 
         let state = get_app_state();
-        let results = state.search_results.lock().unwrap();
+        let results = state.search_results.lock().unwrap().clone();
         let media_type = self.active_page().to_string();
         let active_status = self.active_status().to_string();
 
@@ -492,59 +584,64 @@ impl qobject::AppController {
         }
         drop(results);
 
-        // Cache posters synchronously (they're small images, and we only
-        // download for the items actually being added)
+        // Items already in the library will be skipped by the batch insert,
+        // so don't download their posters. The insert still re-checks, in
+        // case something was added in between.
+        let duplicates = db::queries::find_duplicates(&state.read_db.lock().unwrap(), &items_to_add)
+            .unwrap_or_default();
+        for (url, &duplicate) in poster_urls.iter_mut().zip(&duplicates) {
+            if duplicate {
+                *url = None;
+            }
+        }
+
+        // Cache posters before inserting (we only download for the items
+        // actually being added). Downloads run concurrently so a batch add
+        // costs roughly one round-trip instead of one per poster.
         let cache_dir = state.data_dir.join("image_cache");
         let qt_thread = self.qt_thread();
 
-        std::thread::spawn(move || {
-            let rt = tokio::runtime::Runtime::new().unwrap();
-            rt.block_on(async {
-                let client = reqwest::Client::builder()
-                    .timeout(std::time::Duration::from_secs(15))
-                    .build()
-                    .unwrap_or_default();
-
-                for (i, url_opt) in poster_urls.iter().enumerate() {
-                    if let Some(url) = url_opt {
-                        if !url.is_empty() {
-                            if let Ok(path) = images::cache::cache_poster(&client, &cache_dir, url).await {
-                                let stored_path = path
-                                    .strip_prefix(&state.data_dir)
-                                    .map(|p| p.to_string_lossy().to_string())
-                                    .unwrap_or_else(|_| path.to_string_lossy().to_string());
-                                items_to_add[i].poster_url = Some(stored_path);
-                            }
-                        }
-                    }
+        api::runtime().spawn(async move {
+            let client = api::http_client();
+
+            let mut downloads = tokio::task::JoinSet::new();
+            for (i, url_opt) in poster_urls.into_iter().enumerate() {
+                if let Some(url) = url_opt.filter(|u| !u.is_empty()) {
+                    let cache_dir = cache_dir.clone();
+                    downloads.spawn(async move {
+                        (i, images::cache::cache_poster(client, &cache_dir, &url).await)
+                    });
                 }
+            }
 
-                let state = get_app_state();
-                let conn = state.db.lock().unwrap();
-                match db::queries::add_items_batch(&conn, &items_to_add, true) {
+            while let Some(joined) = downloads.join_next().await {
+                if let Ok((i, Ok(path))) = joined {
+                    let stored_path = path
+                        .strip_prefix(&state.data_dir)
+                        .map(|p| p.to_string_lossy().to_string())
+                        .unwrap_or_else(|_| path.to_string_lossy().to_string());
+                    items_to_add[i].poster_url = Some(stored_path);
+                }
+            }
+
+            queue_db_write(move |conn| {
+                let result = db::queries::add_items_batch(conn, &items_to_add, true);
+                qt_thread.queue(move |mut ctrl: Pin<&mut qobject::AppController>| match result {
                     Ok(result) => {
-                        drop(conn);
                         let msg = format!(
                             "Added {}, skipped {} duplicates",
                             result.added, result.skipped
                         );
-                        qt_thread.queue(move |mut ctrl: Pin<&mut qobject::AppController>| {
-                            ctrl.as_mut().toast_message(QString::from(&msg), QString::from("success"));
-                            ctrl.as_mut().reload_items();
-                            ctrl.as_mut().reload_counts();
-                        }).unwrap();
+                        ctrl.as_mut().toast_message(QString::from(&msg), QString::from("success"));
+                        ctrl.as_mut().reload_all();
                     }
                     Err(e) => {
-                        drop(conn);
-                        let msg = format!("Error: {}", e);
-                        qt_thread.queue(move |mut ctrl: Pin<&mut qobject::AppController>| {
-                            ctrl.as_mut().toast_message(
-                                QString::from(&msg),
-                                QString::from("error"),
-                            );
-                        }).unwrap();
+                        ctrl.as_mut().toast_message(
+                            QString::from(&format!("Error: {}", e)),
+                            QString::from("error"),
+                        );
                     }
-                }
+                }).unwrap();
             });
         });
     }
@@ -619,47 +716,108 @@ impl qobject::AppController {
 
     // ---- Internal helpers ----
 
+    /// Run `write` on the database writer thread, then `done` with its result
+    /// back on the GUI thread.
+    fn write_db<T: Send + 'static>(
+        self: Pin<&mut Self>,
+        write: impl FnOnce(&rusqlite::Connection) -> T + Send + 'static,
+        done: impl FnOnce(Pin<&mut Self>, T) + Send + 'static,
+    ) {
+        let qt_thread = self.qt_thread();
+        queue_db_write(move |conn| {
+            let result = write(conn);
+            qt_thread.queue(move |ctrl| done(ctrl, result)).unwrap();
+        });
+    }
+
+    /// Active page and status. Write callbacks compare this with the value
+    /// captured when the write was queued before patching the list in place.
+    fn current_view(&self) -> (String, String) {
+        (self.active_page().to_string(), self.active_status().to_string())
+    }
+
     fn reload_items(mut self: Pin<&mut Self>) {
+        self.as_mut().refresh_status_counts();
+        // Signal QML to reload MediaModel (which does its own query for the actual rows)
+        self.as_mut().items_changed();
+    }
+
+    fn refresh_status_counts(mut self: Pin<&mut Self>) {
         let page = self.active_page().to_string();
-        let status = self.active_status().to_string();
         let search = self.search_term().to_string();
 
         let state = get_app_state();
-        let conn = state.db.lock().unwrap();
+        let conn = state.read_db.lock().unwrap();
 
         let search_opt = if search.is_empty() { None } else { Some(search.as_str()) };
-        let count = db::queries::count_filtered_items(
-            &conn, Some(&page), Some(&status), search_opt,
-        ).unwrap_or(0);
-
-        self.as_mut().set_item_count(count as i32);
-
-        if let Ok(status_counts) = db::queries::get_status_counts(&conn, &page, search_opt) {
-            self.as_mut().set_on_drive_count(*status_counts.get("On Drive").unwrap_or(&0) as i32);
-            self.as_mut().set_to_download_count(*status_counts.get("To Download").unwrap_or(&0) as i32);
-            self.as_mut().set_to_work_on_count(*status_counts.get("To Work On").unwrap_or(&0) as i32);
-        } else {
-            self.as_mut().set_on_drive_count(0);
-            self.as_mut().set_to_download_count(0);
-            self.as_mut().set_to_work_on_count(0);
-        }
 
+        // One grouped query yields both the per-tab counts and the active
+        // tab's item count, so the filtered set is only scanned once.
+        let status_counts = db::queries::get_status_counts(&conn, &page, search_opt).unwrap_or_default();
         drop(conn);
 
-        // Signal QML to reload MediaModel (which does its own query for the actual rows)
-        self.as_mut().items_changed();
+        self.as_mut().apply_status_counts(|status| status_counts.get(status).copied().unwrap_or(0));
     }
 
     fn reload_counts(mut self: Pin<&mut Self>) {
         let state = get_app_state();
-        let conn = state.db.lock().unwrap();
+        let conn = state.read_db.lock().unwrap();
         if let Ok(counts) = db::queries::get_counts(&conn) {
-            self.as_mut().set_movie_count(*counts.get("Movie").unwrap_or(&0) as i32);
-            self.as_mut().set_tv_count(*counts.get("TV").unwrap_or(&0) as i32);
-            self.as_mut().set_anime_count(*counts.get("Anime").unwrap_or(&0) as i32);
+            drop(conn);
+            self.as_mut().apply_type_counts(|media_type| counts.get(media_type).copied().unwrap_or(0));
         }
         self.as_mut().counts_changed();
     }
+
+    /// `reload_items` followed by `reload_counts`. Without a search filter
+    /// a single query grouped by type and status serves both, instead of
+    /// one pass over the table for each.
+    fn reload_all(mut self: Pin<&mut Self>) {
+        if !self.search_term().is_empty() {
+            self.as_mut().reload_items();
+            self.as_mut().reload_counts();
+            return;
+        }
+
+        let page = self.active_page().to_string();
+        let state = get_app_state();
+        let conn = state.read_db.lock().unwrap();
+        let Ok(counts) = db::queries::get_type_status_counts(&conn) else {
+            drop(conn);
+            self.as_mut().reload_items();
+            self.as_mut().reload_counts();
+            return;
+        };
+        drop(conn);
+
+        self.as_mut().apply_status_counts(|status| {
+            counts.get(&(page.clone(), status.to_string())).copied().unwrap_or(0)
+        });
+        self.as_mut().items_changed();
+        self.as_mut().apply_type_counts(|media_type| {
+            counts
+                .iter()
+                .filter(|((t, _), _)| t == media_type)
+                .map(|(_, n)| n)
+                .sum()
+        });
+        self.as_mut().counts_changed();
+    }
+
+    /// Set the active page's per-status counts and the active tab's count.
+    fn apply_status_counts(mut self: Pin<&mut Self>, count: impl Fn(&str) -> i64) {
+        let status = self.active_status().to_string();
+        self.as_mut().set_item_count(count(&status) as i32);
+        self.as_mut().set_on_drive_count(count("On Drive") as i32);
+        self.as_mut().set_to_download_count(count("To Download") as i32);
+        self.as_mut().set_to_work_on_count(count("To Work On") as i32);
+    }
+
+    fn apply_type_counts(mut self: Pin<&mut Self>, count: impl Fn(&str) -> i64) {
+        self.as_mut().set_movie_count(count("Movie") as i32);
+        self.as_mut().set_tv_count(count("TV") as i32);
+        self.as_mut().set_anime_count(count("Anime") as i32);
+    }
 }
 
 fn opt_string(s: &QString) -> Option<String> {
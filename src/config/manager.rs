@@ -5,7 +5,10 @@ pub fn load_config(data_dir: &Path) -> Result<(AppConfig, std::path::PathBuf), B
     let config_path = data_dir.join("config.json");
     if config_path.exists() {
         let data = std::fs::read_to_string(&config_path)?;
-        let config: AppConfig = serde_json::from_str(&data).unwrap_or_default();
+        let mut config: AppConfig = serde_json::from_str(&data).unwrap_or_default();
+        // Saved lists are already sorted; this covers hand-edited files so
+        // the dialogs can use the list as-is.
+        config.quality_types.sort_by_cached_key(|s| s.to_lowercase());
         Ok((config, config_path))
     } else {
         let config = AppConfig::default();
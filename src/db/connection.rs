@@ -1,16 +1,67 @@
-use rusqlite::Connection;
+use rusqlite::{Connection, OpenFlags};
+
+const DB_FILE: &str = "media_tracker.db";
 
 pub fn init_db(data_dir: &std::path::Path) -> Result<Connection, Box<dyn std::error::Error>> {
     std::fs::create_dir_all(data_dir)?;
-    let db_path = data_dir.join("media_tracker.db");
+    let db_path = data_dir.join(DB_FILE);
     let conn = Connection::open(db_path)?;
-    conn.execute_batch("PRAGMA journal_mode=WAL; PRAGMA busy_timeout=5000;")?;
+    // WAL lets reads run alongside writes; with it, synchronous=NORMAL is
+    // still crash-safe and skips the fsync on every commit.
+    conn.execute_batch(
+        "PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA busy_timeout=5000;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA cache_size=-16000;
+        PRAGMA mmap_size=67108864;",
+    )?;
+    // Room for every fixed statement plus the filter/sort variants of the
+    // list queries, so none of them get recompiled.
+    conn.set_prepared_statement_cache_capacity(64);
     run_migrations(&conn)?;
     Ok(conn)
 }
 
-fn run_migrations(conn: &Connection) -> Result<(), rusqlite::Error> {
+/// Open a read-only connection for the GUI's list and count queries. Under
+/// WAL it reads a consistent snapshot without waiting on the writer, and it
+/// can't take write locks. Call after `init_db` so the schema exists.
+pub fn open_reader(data_dir: &std::path::Path) -> Result<Connection, Box<dyn std::error::Error>> {
+    let conn = Connection::open_with_flags(
+        data_dir.join(DB_FILE),
+        OpenFlags::SQLITE_OPEN_READ_ONLY | OpenFlags::SQLITE_OPEN_NO_MUTEX,
+    )?;
     conn.execute_batch(
+        "PRAGMA busy_timeout=5000;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA cache_size=-16000;
+        PRAGMA mmap_size=67108864;",
+    )?;
+    conn.set_prepared_statement_cache_capacity(64);
+    Ok(conn)
+}
+
+/// Tidy up the long-lived connection at exit: refresh query planner stats
+/// and fold the WAL back into the main file so it doesn't linger on disk.
+pub fn close_db(conn: &Connection) {
+    let _ = conn.execute_batch("PRAGMA optimize; PRAGMA wal_checkpoint(TRUNCATE);");
+}
+
+/// Bump when the schema below changes so existing databases pick it up.
+const SCHEMA_VERSION: i32 = 2;
+
+fn run_migrations(conn: &Connection) -> Result<(), rusqlite::Error> {
+    // Up-to-date databases skip the DDL entirely, so startup doesn't need
+    // a write lock.
+    let version: i32 = conn.query_row("PRAGMA user_version", [], |row| row.get(0))?;
+    if version >= SCHEMA_VERSION {
+        return Ok(());
+    }
+
+    // One transaction for the whole migration: a single commit instead of one
+    // per statement, and a failed step leaves the schema untouched.
+    let tx = conn.unchecked_transaction()?;
+    tx.execute_batch(
         "CREATE TABLE IF NOT EXISTS media_items (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             title TEXT NOT NULL,
@@ -29,7 +80,41 @@ fn run_migrations(conn: &Connection) -> Result<(), rusqlite::Error> {
             updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         );
         CREATE INDEX IF NOT EXISTS idx_media_type_status ON media_items(media_type, status);
-        CREATE INDEX IF NOT EXISTS idx_title ON media_items(title);",
+        -- Duplicate detection looks items up by API ID or by title/year/type.
+        -- The ID indexes are partial since most rows carry only one of the two.
+        CREATE INDEX IF NOT EXISTS idx_anilist_id ON media_items(anilist_id, media_type)
+            WHERE anilist_id IS NOT NULL;
+        CREATE INDEX IF NOT EXISTS idx_tmdb_id ON media_items(tmdb_id, media_type)
+            WHERE tmdb_id IS NOT NULL;
+        CREATE INDEX IF NOT EXISTS idx_title_year_type ON media_items(title, year, media_type);
+        -- Superseded by idx_title_year_type, which also leads with title.
+        DROP INDEX IF EXISTS idx_title;
+
+        -- Trigram full-text index over the searchable text, kept in sync by
+        -- triggers. Trigrams match substrings, like the LIKE '%term%' scans
+        -- they replace, but through an index.
+        CREATE VIRTUAL TABLE IF NOT EXISTS media_items_fts USING fts5(
+            title, native_title, romaji_title, notes,
+            content='media_items', content_rowid='id', tokenize='trigram'
+        );
+        CREATE TRIGGER IF NOT EXISTS media_items_fts_ai AFTER INSERT ON media_items BEGIN
+            INSERT INTO media_items_fts(rowid, title, native_title, romaji_title, notes)
+            VALUES (new.id, new.title, new.native_title, new.romaji_title, new.notes);
+        END;
+        CREATE TRIGGER IF NOT EXISTS media_items_fts_ad AFTER DELETE ON media_items BEGIN
+            INSERT INTO media_items_fts(media_items_fts, rowid, title, native_title, romaji_title, notes)
+            VALUES ('delete', old.id, old.title, old.native_title, old.romaji_title, old.notes);
+        END;
+        CREATE TRIGGER IF NOT EXISTS media_items_fts_au
+        AFTER UPDATE OF title, native_title, romaji_title, notes ON media_items BEGIN
+            INSERT INTO media_items_fts(media_items_fts, rowid, title, native_title, romaji_title, notes)
+            VALUES ('delete', old.id, old.title, old.native_title, old.romaji_title, old.notes);
+            INSERT INTO media_items_fts(rowid, title, native_title, romaji_title, notes)
+            VALUES (new.id, new.title, new.native_title, new.romaji_title, new.notes);
+        END;
+        -- Index rows that existed before the table was created.
+        INSERT INTO media_items_fts(media_items_fts) VALUES ('rebuild');",
     )?;
-    Ok(())
+    tx.pragma_update(None, "user_version", SCHEMA_VERSION)?;
+    tx.commit()
 }
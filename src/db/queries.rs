@@ -1,5 +1,61 @@
 use crate::models::{BatchAddResult, MediaItem};
 use rusqlite::{params, Connection};
+use std::collections::HashSet;
+
+// Fixed SQL shared by the functions below. Statements are prepared through
+// the connection's statement cache, so each is only compiled once.
+const INSERT_ITEM_SQL: &str =
+    "INSERT INTO media_items (title, native_title, romaji_title, year, media_type, status,
+     quality_type, source, notes, tmdb_id, anilist_id, poster_url)
+     VALUES (?1, ?2, ?3, ?4, ?5, ?6, ?7, ?8, ?9, ?10, ?11, ?12)";
+
+const UPDATE_ITEM_SQL: &str =
+    "UPDATE media_items SET title=?1, native_title=?2, romaji_title=?3, year=?4,
+     media_type=?5, status=?6, quality_type=?7, source=?8, notes=?9,
+     poster_url=?10, updated_at=CURRENT_TIMESTAMP
+     WHERE id=?11";
+
+fn insert_item(stmt: &mut rusqlite::CachedStatement, item: &MediaItem) -> rusqlite::Result<usize> {
+    stmt.execute(params![
+        item.title,
+        item.native_title,
+        item.romaji_title,
+        item.year,
+        item.media_type,
+        item.status,
+        item.quality_type,
+        item.source,
+        item.notes,
+        item.tmdb_id,
+        item.anilist_id,
+        item.poster_url,
+    ])
+}
+
+/// Column list for reading whole items; the order matches `row_to_item`.
+macro_rules! select_item_columns {
+    () => {
+        "SELECT id, title, native_title, romaji_title, year, media_type, status,
+                quality_type, source, notes, tmdb_id, anilist_id, poster_url,
+                created_at, updated_at FROM media_items"
+    };
+}
+
+/// Full SQL for one page/status tab in a given sort order. Every combination
+/// is a fixed string, so each one is compiled once by the statement cache.
+/// `id` breaks ties so LIMIT/OFFSET windows line up across calls.
+macro_rules! sorted_items_sql {
+    ($col:literal, $dir:literal) => {
+        concat!(
+            select_item_columns!(),
+            " WHERE media_type = ?1 AND status = ?2 ORDER BY ",
+            $col,
+            " ",
+            $dir,
+            " NULLS LAST, id LIMIT ?3 OFFSET ?4"
+        )
+    };
+}
 
 fn row_to_item(row: &rusqlite::Row) -> rusqlite::Result<MediaItem> {
     Ok(MediaItem {
@@ -21,71 +77,194 @@ fn row_to_item(row: &rusqlite::Row) -> rusqlite::Result<MediaItem> {
     })
 }
 
-pub fn get_items_sorted(
+/// Returns at most `limit` rows starting at `offset`, so the list can be
+/// loaded a page at a time as it scrolls. Rows are passed through `map` as
+/// they're read, so callers can build their own representation without an
+/// intermediate `Vec<MediaItem>`.
+pub fn get_items_sorted<T>(
     conn: &Connection,
-    media_type: Option<&str>,
-    status: Option<&str>,
+    media_type: &str,
+    status: &str,
     sort_field: &str,
     sort_dir: &str,
-) -> Result<Vec<MediaItem>, rusqlite::Error> {
-    let mut sql = String::from(
-        "SELECT id, title, native_title, romaji_title, year, media_type, status,
-                quality_type, source, notes, tmdb_id, anilist_id, poster_url,
-                created_at, updated_at FROM media_items WHERE 1=1",
-    );
-    let mut param_values: Vec<Box<dyn rusqlite::types::ToSql>> = Vec::new();
-
-    if let Some(mt) = media_type {
-        sql.push_str(" AND media_type = ?");
-        param_values.push(Box::new(mt.to_string()));
-    }
-    if let Some(s) = status {
-        sql.push_str(" AND status = ?");
-        param_values.push(Box::new(s.to_string()));
-    }
-
-    // Whitelist sort columns to prevent SQL injection
-    let col = match sort_field {
-        "year" => "year",
-        "quality_type" => "quality_type",
-        "source" => "source",
-        _ => "title",
+    limit: usize,
+    offset: usize,
+    mut map: impl FnMut(MediaItem) -> T,
+) -> Result<Vec<T>, rusqlite::Error> {
+    // Unknown sort fields fall back to title, so only whitelisted columns
+    // ever reach the SQL.
+    let sql = match (sort_field, sort_dir == "DESC") {
+        ("year", false) => sorted_items_sql!("year", "ASC"),
+        ("year", true) => sorted_items_sql!("year", "DESC"),
+        ("quality_type", false) => sorted_items_sql!("quality_type", "ASC"),
+        ("quality_type", true) => sorted_items_sql!("quality_type", "DESC"),
+        ("source", false) => sorted_items_sql!("source", "ASC"),
+        ("source", true) => sorted_items_sql!("source", "DESC"),
+        (_, false) => sorted_items_sql!("title", "ASC"),
+        (_, true) => sorted_items_sql!("title", "DESC"),
     };
-    let dir = if sort_dir == "DESC" { "DESC" } else { "ASC" };
-    sql.push_str(&format!(" ORDER BY {} {} NULLS LAST", col, dir));
 
-    let params_refs: Vec<&dyn rusqlite::types::ToSql> =
-        param_values.iter().map(|p| p.as_ref()).collect();
-    let mut stmt = conn.prepare(&sql)?;
+    let mut stmt = conn.prepare_cached(sql)?;
     let items = stmt
-        .query_map(params_refs.as_slice(), |row| row_to_item(row))?
+        .query_map(params![media_type, status, limit as i64, offset as i64], |row| row_to_item(row).map(&mut map))?
         .collect::<Result<Vec<_>, _>>()?;
     Ok(items)
 }
 
 pub fn add_item(conn: &Connection, item: &MediaItem) -> Result<i64, rusqlite::Error> {
-    conn.execute(
-        "INSERT INTO media_items (title, native_title, romaji_title, year, media_type, status,
-         quality_type, source, notes, tmdb_id, anilist_id, poster_url)
-         VALUES (?1, ?2, ?3, ?4, ?5, ?6, ?7, ?8, ?9, ?10, ?11, ?12)",
-        params![
-            item.title,
-            item.native_title,
-            item.romaji_title,
-            item.year,
-            item.media_type,
-            item.status,
-            item.quality_type,
-            item.source,
-            item.notes,
-            item.tmdb_id,
-            item.anilist_id,
-            item.poster_url,
-        ],
-    )?;
+    insert_item(&mut conn.prepare_cached(INSERT_ITEM_SQL)?, item)?;
     Ok(conn.last_insert_rowid())
 }
 
+/// Duplicate keys already in the database for a batch of candidate items,
+/// fetched up front instead of with per-item lookups.
+///
+/// An item is a duplicate when its API ID matches (AniList IDs for anime,
+/// TMDB ID + media type otherwise) or when title, year and media type all do.
+#[derive(Default)]
+struct ExistingKeys {
+    anilist_ids: HashSet<i64>,
+    tmdb_ids: HashSet<(i64, String)>,
+    titles: HashSet<(String, i32, String)>,
+}
+
+/// Candidate values per lookup bound in one statement, keeping all three
+/// lists together well under SQLite's bound-parameter limit.
+const DUPLICATE_CHUNK: usize = 300;
+
+impl ExistingKeys {
+    /// Fetch every row matching any candidate by AniList ID, TMDB ID or
+    /// title in one query (SQLite serves each OR arm from its own index).
+    /// Keys from all matched rows are recorded: each is a real key in the
+    /// table, so it can only flag true duplicates.
+    fn load(conn: &Connection, items: &[MediaItem]) -> Result<Self, rusqlite::Error> {
+        let anilist_ids: Vec<i64> = items
+            .iter()
+            .filter(|i| i.media_type == "Anime")
+            .filter_map(|i| i.anilist_id)
+            .collect();
+        let tmdb_ids: Vec<i64> = items
+            .iter()
+            .filter(|i| i.media_type != "Anime")
+            .filter_map(|i| i.tmdb_id)
+            .collect();
+        // Rows without a year never match on title (NULL = NULL is false).
+        let titles: Vec<&str> = items
+            .iter()
+            .filter(|i| i.year.is_some())
+            .map(|i| i.title.as_str())
+            .collect();
+
+        let mut keys = Self::default();
+        let rounds = [anilist_ids.len(), tmdb_ids.len(), titles.len()]
+            .into_iter()
+            .map(|n| n.div_ceil(DUPLICATE_CHUNK))
+            .max()
+            .unwrap_or(0);
+
+        for round in 0..rounds {
+            let anilist_ids = chunk_at(&anilist_ids, round);
+            let tmdb_ids = chunk_at(&tmdb_ids, round);
+            let titles = chunk_at(&titles, round);
+
+            let mut conditions = Vec::new();
+            let mut param_values: Vec<&dyn rusqlite::types::ToSql> = Vec::new();
+            if !anilist_ids.is_empty() {
+                conditions.push(format!("anilist_id IN ({})", placeholders(anilist_ids.len())));
+                param_values.extend(anilist_ids.iter().map(|v| v as &dyn rusqlite::types::ToSql));
+            }
+            if !tmdb_ids.is_empty() {
+                conditions.push(format!("tmdb_id IN ({})", placeholders(tmdb_ids.len())));
+                param_values.extend(tmdb_ids.iter().map(|v| v as &dyn rusqlite::types::ToSql));
+            }
+            if !titles.is_empty() {
+                conditions.push(format!(
+                    "(year IS NOT NULL AND title IN ({}))",
+                    placeholders(titles.len())
+                ));
+                param_values.extend(titles.iter().map(|v| v as &dyn rusqlite::types::ToSql));
+            }
+
+            let sql = format!(
+                "SELECT anilist_id, tmdb_id, title, year, media_type FROM media_items WHERE {}",
+                conditions.join(" OR ")
+            );
+            let mut stmt = conn.prepare(&sql)?;
+            let mut rows = stmt.query(param_values.as_slice())?;
+            while let Some(row) = rows.next()? {
+                let title: String = row.get(2)?;
+                let media_type: String = row.get(4)?;
+                keys.insert(row.get(0)?, row.get(1)?, &title, row.get(3)?, &media_type);
+            }
+        }
+        Ok(keys)
+    }
+
+    fn contains(&self, item: &MediaItem) -> bool {
+        let by_id = if item.media_type == "Anime" {
+            item.anilist_id.is_some_and(|id| self.anilist_ids.contains(&id))
+        } else {
+            item.tmdb_id
+                .is_some_and(|id| self.tmdb_ids.contains(&(id, item.media_type.clone())))
+        };
+        by_id
+            || item.year.is_some_and(|year| {
+                self.titles
+                    .contains(&(item.title.clone(), year, item.media_type.clone()))
+            })
+    }
+
+    fn add(&mut self, item: &MediaItem) {
+        self.insert(item.anilist_id, item.tmdb_id, &item.title, item.year, &item.media_type);
+    }
+
+    fn insert(
+        &mut self,
+        anilist_id: Option<i64>,
+        tmdb_id: Option<i64>,
+        title: &str,
+        year: Option<i32>,
+        media_type: &str,
+    ) {
+        if let Some(id) = anilist_id {
+            self.anilist_ids.insert(id);
+        }
+        if let Some(id) = tmdb_id {
+            self.tmdb_ids.insert((id, media_type.to_string()));
+        }
+        if let Some(year) = year {
+            self.titles
+                .insert((title.to_string(), year, media_type.to_string()));
+        }
+    }
+}
+
+/// The `round`-th chunk of `values`, or an empty slice once it runs out.
+fn chunk_at<T>(values: &[T], round: usize) -> &[T] {
+    values.chunks(DUPLICATE_CHUNK).nth(round).unwrap_or(&[])
+}
+
+fn placeholders(count: usize) -> String {
+    vec!["?"; count].join(", ")
+}
+
+/// Which of `items` `add_items_batch` would skip as duplicates, either of a
+/// stored item or of an earlier item in the same list. Lets callers skip
+/// work (like poster downloads) for items that won't be added.
+pub fn find_duplicates(conn: &Connection, items: &[MediaItem]) -> Result<Vec<bool>, rusqlite::Error> {
+    let mut existing = ExistingKeys::load(conn, items)?;
+    Ok(items
+        .iter()
+        .map(|item| {
+            let duplicate = existing.contains(item);
+            if !duplicate {
+                existing.add(item);
+            }
+            duplicate
+        })
+        .collect())
+}
+
 pub fn add_items_batch(
     conn: &Connection,
     items: &[MediaItem],
@@ -101,33 +280,23 @@ pub fn add_items_batch(
     };
 
     let tx = conn.unchecked_transaction()?;
+    let mut existing = if skip_duplicates {
+        ExistingKeys::load(&tx, items)?
+    } else {
+        ExistingKeys::default()
+    };
+    let mut insert = tx.prepare_cached(INSERT_ITEM_SQL)?;
     for item in items {
-        if skip_duplicates && check_duplicate_by_id(&tx, item)? {
+        if skip_duplicates && existing.contains(item) {
             result.skipped += 1;
             result.skipped_items.push(item.title.clone());
             continue;
         }
 
-        match tx.execute(
-            "INSERT INTO media_items (title, native_title, romaji_title, year, media_type, status,
-             quality_type, source, notes, tmdb_id, anilist_id, poster_url)
-             VALUES (?1, ?2, ?3, ?4, ?5, ?6, ?7, ?8, ?9, ?10, ?11, ?12)",
-            params![
-                item.title,
-                item.native_title,
-                item.romaji_title,
-                item.year,
-                item.media_type,
-                item.status,
-                item.quality_type,
-                item.source,
-                item.notes,
-                item.tmdb_id,
-                item.anilist_id,
-                item.poster_url,
-            ],
-        ) {
+        match insert_item(&mut insert, item) {
             Ok(_) => {
+                // Later items in the same batch must see this one as existing.
+                existing.add(item);
                 result.added += 1;
                 result.added_items.push(item.title.clone());
             }
@@ -139,6 +308,7 @@ pub fn add_items_batch(
             }
         }
     }
+    drop(insert);
     tx.commit()?;
     Ok(result)
 }
@@ -146,25 +316,19 @@ pub fn add_items_batch(
 pub fn update_item(conn: &Connection, item: &MediaItem) -> Result<(), rusqlite::Error> {
     // Don't overwrite tmdb_id/anilist_id — they're set on initial add from search
     // and the edit dialog doesn't expose them, so they'd be wiped to NULL.
-    conn.execute(
-        "UPDATE media_items SET title=?1, native_title=?2, romaji_title=?3, year=?4,
-         media_type=?5, status=?6, quality_type=?7, source=?8, notes=?9,
-         poster_url=?10, updated_at=CURRENT_TIMESTAMP
-         WHERE id=?11",
-        params![
-            item.title,
-            item.native_title,
-            item.romaji_title,
-            item.year,
-            item.media_type,
-            item.status,
-            item.quality_type,
-            item.source,
-            item.notes,
-            item.poster_url,
-            item.id,
-        ],
-    )?;
+    conn.prepare_cached(UPDATE_ITEM_SQL)?.execute(params![
+        item.title,
+        item.native_title,
+        item.romaji_title,
+        item.year,
+        item.media_type,
+        item.status,
+        item.quality_type,
+        item.source,
+        item.notes,
+        item.poster_url,
+        item.id,
+    ])?;
     Ok(())
 }
 
@@ -229,21 +393,45 @@ pub fn move_items(
     Ok(())
 }
 
-pub fn search_items(
+/// WHERE condition matching `term` anywhere in the titles or notes.
+///
+/// Terms of three or more characters go through the trigram FTS index as a
+/// quoted phrase. Shorter ones can't be matched by trigrams and fall back to
+/// a LIKE scan.
+fn text_search_filter(term: &str) -> (&'static str, Vec<Box<dyn rusqlite::types::ToSql>>) {
+    if term.chars().count() >= 3 {
+        let phrase = format!("\"{}\"", term.replace('"', "\"\""));
+        (
+            "id IN (SELECT rowid FROM media_items_fts WHERE media_items_fts MATCH ?)",
+            vec![Box::new(phrase)],
+        )
+    } else {
+        let pattern = format!("%{}%", term);
+        (
+            "(title LIKE ? OR notes LIKE ? OR native_title LIKE ? OR romaji_title LIKE ?)",
+            vec![
+                Box::new(pattern.clone()),
+                Box::new(pattern.clone()),
+                Box::new(pattern.clone()),
+                Box::new(pattern),
+            ],
+        )
+    }
+}
+
+/// Like `get_items_sorted`, returns one `limit`/`offset` window of the
+/// matches and passes rows through `map` as they're read.
+pub fn search_items<T>(
     conn: &Connection,
     term: &str,
     media_type: Option<&str>,
     status: Option<&str>,
-) -> Result<Vec<MediaItem>, rusqlite::Error> {
-    let search_pattern = format!("%{}%", term);
-    let mut sql = String::from(
-        "SELECT id, title, native_title, romaji_title, year, media_type, status,
-                quality_type, source, notes, tmdb_id, anilist_id, poster_url,
-                created_at, updated_at FROM media_items
-         WHERE (title LIKE ?1 OR notes LIKE ?1 OR native_title LIKE ?1 OR romaji_title LIKE ?1)",
-    );
-    let mut param_values: Vec<Box<dyn rusqlite::types::ToSql>> = Vec::new();
-    param_values.push(Box::new(search_pattern));
+    limit: usize,
+    offset: usize,
+    mut map: impl FnMut(MediaItem) -> T,
+) -> Result<Vec<T>, rusqlite::Error> {
+    let (filter, mut param_values) = text_search_filter(term);
+    let mut sql = format!("{} WHERE {}", select_item_columns!(), filter);
 
     if let Some(mt) = media_type {
         sql.push_str(" AND media_type = ?");
@@ -255,91 +443,19 @@ pub fn search_items(
         param_values.push(Box::new(s.to_string()));
     }
 
-    sql.push_str(" ORDER BY title ASC");
+    sql.push_str(" ORDER BY title ASC, id LIMIT ? OFFSET ?");
+    param_values.push(Box::new(limit as i64));
+    param_values.push(Box::new(offset as i64));
 
     let params_refs: Vec<&dyn rusqlite::types::ToSql> =
         param_values.iter().map(|p| p.as_ref()).collect();
-    let mut stmt = conn.prepare(&sql)?;
+    let mut stmt = conn.prepare_cached(&sql)?;
     let items = stmt
-        .query_map(params_refs.as_slice(), |row| row_to_item(row))?
+        .query_map(params_refs.as_slice(), |row| row_to_item(row).map(&mut map))?
         .collect::<Result<Vec<_>, _>>()?;
     Ok(items)
 }
 
-pub fn check_duplicate_by_id(
-    conn: &Connection,
-    item: &MediaItem,
-) -> Result<bool, rusqlite::Error> {
-    // Check by API ID first
-    if item.media_type == "Anime" {
-        if let Some(anilist_id) = item.anilist_id {
-            let count: i64 = conn.query_row(
-                "SELECT COUNT(*) FROM media_items WHERE anilist_id = ?1",
-                params![anilist_id],
-                |row| row.get(0),
-            )?;
-            if count > 0 {
-                return Ok(true);
-            }
-        }
-    } else {
-        if let Some(tmdb_id) = item.tmdb_id {
-            let count: i64 = conn.query_row(
-                "SELECT COUNT(*) FROM media_items WHERE tmdb_id = ?1 AND media_type = ?2",
-                params![tmdb_id, item.media_type],
-                |row| row.get(0),
-            )?;
-            if count > 0 {
-                return Ok(true);
-            }
-        }
-    }
-
-    // Fall back to title + year check
-    let count: i64 = conn.query_row(
-        "SELECT COUNT(*) FROM media_items WHERE title = ?1 AND year = ?2 AND media_type = ?3",
-        params![item.title, item.year, item.media_type],
-        |row| row.get(0),
-    )?;
-    Ok(count > 0)
-}
-
-pub fn count_filtered_items(
-    conn: &Connection,
-    media_type: Option<&str>,
-    status: Option<&str>,
-    search: Option<&str>,
-) -> Result<i64, rusqlite::Error> {
-    let mut sql = String::from("SELECT COUNT(*) FROM media_items WHERE 1=1");
-    let mut param_values: Vec<Box<dyn rusqlite::types::ToSql>> = Vec::new();
-
-    if let Some(mt) = media_type {
-        sql.push_str(" AND media_type = ?");
-        param_values.push(Box::new(mt.to_string()));
-    }
-
-    if let Some(term) = search {
-        if !term.is_empty() {
-            let pattern = format!("%{}%", term);
-            sql.push_str(" AND (title LIKE ? OR notes LIKE ? OR native_title LIKE ? OR romaji_title LIKE ?)");
-            param_values.push(Box::new(pattern.clone()));
-            param_values.push(Box::new(pattern.clone()));
-            param_values.push(Box::new(pattern.clone()));
-            param_values.push(Box::new(pattern));
-        }
-    }
-
-    if let Some(s) = status {
-        sql.push_str(" AND status = ?");
-        param_values.push(Box::new(s.to_string()));
-    }
-
-    let params_refs: Vec<&dyn rusqlite::types::ToSql> =
-        param_values.iter().map(|p| p.as_ref()).collect();
-    conn.query_row(&sql, params_refs.as_slice(), |row| row.get(0))
-}
-
-
 pub fn get_status_counts(
     conn: &Connection,
     media_type: &str,
@@ -353,12 +469,10 @@ pub fn get_status_counts(
 
     if let Some(term) = search {
         if !term.is_empty() {
-            let pattern = format!("%{}%", term);
-            sql.push_str(" AND (title LIKE ? OR notes LIKE ? OR native_title LIKE ? OR romaji_title LIKE ?)");
-            param_values.push(Box::new(pattern.clone()));
-            param_values.push(Box::new(pattern.clone()));
-            param_values.push(Box::new(pattern.clone()));
-            param_values.push(Box::new(pattern));
+            let (filter, filter_params) = text_search_filter(term);
+            sql.push_str(" AND ");
+            sql.push_str(filter);
+            param_values.extend(filter_params);
         }
     }
 
@@ -366,7 +480,7 @@ pub fn get_status_counts(
 
     let params_refs: Vec<&dyn rusqlite::types::ToSql> =
         param_values.iter().map(|p| p.as_ref()).collect();
-    let mut stmt = conn.prepare(&sql)?;
+    let mut stmt = conn.prepare_cached(&sql)?;
     let rows = stmt.query_map(params_refs.as_slice(), |row| {
         Ok((row.get::<_, String>(0)?, row.get::<_, i64>(1)?))
     })?;
@@ -380,11 +494,26 @@ pub fn get_status_counts(
     Ok(counts)
 }
 
+/// Item counts per (media type, status) pair, from one pass over the
+/// (media_type, status) index. Covers both `get_counts` and an unfiltered
+/// `get_status_counts`.
+pub fn get_type_status_counts(
+    conn: &Connection,
+) -> Result<std::collections::HashMap<(String, String), i64>, rusqlite::Error> {
+    let mut stmt = conn.prepare_cached(
+        "SELECT media_type, status, COUNT(*) FROM media_items GROUP BY media_type, status",
+    )?;
+    let rows = stmt.query_map([], |row| {
+        Ok(((row.get::<_, String>(0)?, row.get::<_, String>(1)?), row.get::<_, i64>(2)?))
+    })?;
+    rows.collect()
+}
+
 pub fn get_counts(
     conn: &Connection,
 ) -> Result<std::collections::HashMap<String, i64>, rusqlite::Error> {
     let mut counts = std::collections::HashMap::new();
-    let mut stmt = conn.prepare(
+    let mut stmt = conn.prepare_cached(
         "SELECT media_type, COUNT(*) FROM media_items GROUP BY media_type",
     )?;
     let rows = stmt.query_map([], |row| {
@@ -18,6 +18,12 @@ pub mod qobject {
 
         include!("cxx-qt-lib/qstring.h");
         type QString = cxx_qt_lib::QString;
+
+        include!("cxx-qt-lib/qlist.h");
+        type QList_i32 = cxx_qt_lib::QList<i32>;
+
+        include!("cxx-qt-lib/qmap.h");
+        type QMap_QString_QVariant = cxx_qt_lib::QMap<cxx_qt_lib::QMapPair_QString_QVariant>;
     }
 
     // ── MediaModel ──────────────────────────────────────────────────────
@@ -41,9 +47,27 @@ pub mod qobject {
         #[cxx_name = "rowCount"]
         fn row_count(self: &MediaModel, parent: &QModelIndex) -> i32;
 
+        #[qinvokable]
+        #[cxx_override]
+        #[cxx_name = "canFetchMore"]
+        fn can_fetch_more(self: &MediaModel, parent: &QModelIndex) -> bool;
+
+        #[qinvokable]
+        #[cxx_override]
+        #[cxx_name = "fetchMore"]
+        fn fetch_more(self: Pin<&mut MediaModel>, parent: &QModelIndex);
+
         #[qinvokable]
         fn reload(self: Pin<&mut MediaModel>, page: &QString, status: &QString, search: &QString, sort_field: &QString, sort_dir: &QString);
 
+        #[qinvokable]
+        #[cxx_name = "removeItems"]
+        fn remove_items(self: Pin<&mut MediaModel>, ids: &QString);
+
+        #[qinvokable]
+        #[cxx_name = "getItem"]
+        fn get_item(self: &MediaModel, row: i32) -> QMap_QString_QVariant;
+
         #[qinvokable]
         #[cxx_name = "getItemId"]
         fn get_item_id(self: &MediaModel, row: i32) -> i32;
@@ -68,6 +92,18 @@ pub mod qobject {
         #[inherit]
         #[cxx_name = "endResetModel"]
         unsafe fn end_reset_model_media(self: Pin<&mut MediaModel>);
+        #[inherit]
+        #[cxx_name = "beginInsertRows"]
+        unsafe fn begin_insert_rows_media(self: Pin<&mut MediaModel>, parent: &QModelIndex, first: i32, last: i32);
+        #[inherit]
+        #[cxx_name = "endInsertRows"]
+        unsafe fn end_insert_rows_media(self: Pin<&mut MediaModel>);
+        #[inherit]
+        #[cxx_name = "beginRemoveRows"]
+        unsafe fn begin_remove_rows_media(self: Pin<&mut MediaModel>, parent: &QModelIndex, first: i32, last: i32);
+        #[inherit]
+        #[cxx_name = "endRemoveRows"]
+        unsafe fn end_remove_rows_media(self: Pin<&mut MediaModel>);
     }
 
     // ── SearchModel ─────────────────────────────────────────────────────
@@ -104,6 +140,10 @@ pub mod qobject {
         #[cxx_name = "getSelectedIndices"]
         fn get_selected_indices(self: &SearchModel) -> QString;
 
+        #[qinvokable]
+        #[cxx_name = "getItem"]
+        fn get_item(self: &SearchModel, row: i32) -> QMap_QString_QVariant;
+
         #[qinvokable]
         fn clear(self: Pin<&mut SearchModel>);
     }
@@ -115,15 +155,28 @@ pub mod qobject {
         #[inherit]
         #[cxx_name = "endResetModel"]
         unsafe fn end_reset_model_search(self: Pin<&mut SearchModel>);
+        #[inherit]
+        fn index(self: &SearchModel, row: i32, column: i32, parent: &QModelIndex) -> QModelIndex;
+        #[inherit]
+        #[qsignal]
+        #[cxx_name = "dataChanged"]
+        fn data_changed(self: Pin<&mut SearchModel>, top_left: &QModelIndex, bottom_right: &QModelIndex, roles: &QList_i32);
     }
 }
 
 use core::pin::Pin;
 use cxx_qt::CxxQtType;
-use cxx_qt_lib::{QByteArray, QHash, QHashPair_i32_QByteArray, QModelIndex, QString, QVariant};
+use cxx_qt_lib::{
+    QByteArray, QHash, QHashPair_i32_QByteArray, QList, QMap, QMapPair_QString_QVariant, QModelIndex,
+    QString, QVariant,
+};
+use std::collections::{HashMap, HashSet};
+use std::fmt::Write;
+use std::sync::Arc;
 
 use crate::bridge::get_app_state;
 use crate::db;
+use crate::models::{MediaItem, SearchResult};
 
 // ═══════════════════════════════════════════════════════════════════════
 // MediaModel roles & types
@@ -143,108 +196,190 @@ const MEDIA_ROLE_NOTES: i32 = 265;
 const MEDIA_ROLE_POSTER_PATH: i32 = 266;
 const MEDIA_ROLE_HAS_POSTER: i32 = 267;
 
+/// Every role with the name QML sees it under.
+const MEDIA_ROLES: [(i32, &str); 12] = [
+    (MEDIA_ROLE_ID, "itemId"),
+    (MEDIA_ROLE_TITLE, "title"),
+    (MEDIA_ROLE_NATIVE_TITLE, "nativeTitle"),
+    (MEDIA_ROLE_ROMAJI_TITLE, "romajiTitle"),
+    (MEDIA_ROLE_YEAR, "year"),
+    (MEDIA_ROLE_MEDIA_TYPE, "mediaType"),
+    (MEDIA_ROLE_STATUS, "status"),
+    (MEDIA_ROLE_QUALITY_TYPE, "qualityType"),
+    (MEDIA_ROLE_SOURCE, "source"),
+    (MEDIA_ROLE_NOTES, "notes"),
+    (MEDIA_ROLE_POSTER_PATH, "posterPath"),
+    (MEDIA_ROLE_HAS_POSTER, "hasPoster"),
+];
+
+/// One row of the media grid/list. Text is kept as boxed `str` (no spare
+/// capacity word) since rows are never edited in place.
 struct DisplayItem {
     id: i32,
-    title: String,
-    native_title: String,
-    romaji_title: String,
     year: i32,
-    media_type: String,
+    title: Box<str>,
+    native_title: Box<str>,
+    romaji_title: Box<str>,
+    // Few distinct values shared by many rows, so each one is stored once.
+    media_type: Arc<str>,
+    status: Arc<str>,
+    quality_type: Arc<str>,
+    source: Box<str>,
+    notes: Box<str>,
+    /// Resolved poster URL, shared with `resolved_posters` and every other
+    /// row showing the same poster. Empty when the item has no poster.
+    poster_path: Arc<str>,
+}
+
+/// Rows fetched per query. Views pull further pages through `fetchMore` as
+/// they scroll, so a large library isn't loaded all at once.
+const MEDIA_PAGE_SIZE: usize = 200;
+
+/// Filter and sort order of the last `reload`, reused for later pages.
+#[derive(Default)]
+struct ItemQuery {
+    page: String,
     status: String,
-    quality_type: String,
-    source: String,
-    notes: String,
-    poster_path: String,
-    has_poster: bool,
+    search: String,
+    sort_field: String,
+    sort_dir: String,
 }
 
 #[derive(Default)]
 pub struct MediaModelRust {
     items: Vec<DisplayItem>,
+    query: ItemQuery,
+    /// False once a query returns a short page.
+    has_more: bool,
+    /// Shared copies of repeated column values, kept across the pages of
+    /// one query.
+    interned: HashSet<Arc<str>>,
+    /// Stored poster path -> resolved file URL, for posters found on disk.
+    /// Saves re-checking the filesystem for every row on each reload.
+    resolved_posters: HashMap<String, Arc<str>>,
+}
+
+impl MediaModelRust {
+    /// Load the page of the current query starting at row `offset`.
+    fn load_page(&mut self, offset: usize) -> Vec<DisplayItem> {
+        let Self { query, has_more, interned, resolved_posters, .. } = self;
+
+        let mut intern = |s: &str| -> Arc<str> {
+            if let Some(shared) = interned.get(s) {
+                return shared.clone();
+            }
+            let shared: Arc<str> = Arc::from(s);
+            interned.insert(shared.clone());
+            shared
+        };
+        // Rows are converted as they're read, moving their strings straight
+        // into the display items. Posters are resolved after the DB lock is
+        // released, so the stored path is carried alongside until then.
+        let no_poster: Arc<str> = Arc::from("");
+        let to_display = |item: MediaItem| {
+            let display = DisplayItem {
+                id: item.id.unwrap_or(-1) as i32,
+                title: item.title.into(),
+                native_title: item.native_title.unwrap_or_default().into(),
+                romaji_title: item.romaji_title.unwrap_or_default().into(),
+                year: item.year.unwrap_or(0),
+                media_type: intern(&item.media_type),
+                status: intern(&item.status),
+                quality_type: intern(item.quality_type.as_deref().unwrap_or_default()),
+                source: item.source.unwrap_or_default().into(),
+                notes: item.notes.unwrap_or_default().into(),
+                poster_path: no_poster.clone(),
+            };
+            (display, item.poster_url)
+        };
+
+        let state = get_app_state();
+        let conn = state.read_db.lock().unwrap();
+
+        let rows = if query.search.is_empty() {
+            db::queries::get_items_sorted(&conn, &query.page, &query.status, &query.sort_field, &query.sort_dir, MEDIA_PAGE_SIZE, offset, to_display).unwrap_or_default()
+        } else {
+            db::queries::search_items(&conn, &query.search, Some(&query.page), Some(&query.status), MEDIA_PAGE_SIZE, offset, to_display).unwrap_or_default()
+        };
+        drop(conn);
+        *has_more = rows.len() == MEDIA_PAGE_SIZE;
+
+        rows.into_iter()
+            .map(|(mut item, stored)| {
+                if let Some(path) = resolve_poster_cached(resolved_posters, stored.as_deref(), &state.data_dir) {
+                    item.poster_path = path;
+                }
+                item
+            })
+            .collect()
+    }
 }
 
 impl qobject::MediaModel {
     pub fn data(&self, index: &QModelIndex, role: i32) -> QVariant {
         let row = index.row() as usize;
         if let Some(item) = self.items.get(row) {
-            return match role {
-                MEDIA_ROLE_ID => QVariant::from(&item.id),
-                MEDIA_ROLE_TITLE => QVariant::from(&QString::from(&item.title)),
-                MEDIA_ROLE_NATIVE_TITLE => QVariant::from(&QString::from(&item.native_title)),
-                MEDIA_ROLE_ROMAJI_TITLE => QVariant::from(&QString::from(&item.romaji_title)),
-                MEDIA_ROLE_YEAR => QVariant::from(&item.year),
-                MEDIA_ROLE_MEDIA_TYPE => QVariant::from(&QString::from(&item.media_type)),
-                MEDIA_ROLE_STATUS => QVariant::from(&QString::from(&item.status)),
-                MEDIA_ROLE_QUALITY_TYPE => QVariant::from(&QString::from(&item.quality_type)),
-                MEDIA_ROLE_SOURCE => QVariant::from(&QString::from(&item.source)),
-                MEDIA_ROLE_NOTES => QVariant::from(&QString::from(&item.notes)),
-                MEDIA_ROLE_POSTER_PATH => QVariant::from(&QString::from(&item.poster_path)),
-                MEDIA_ROLE_HAS_POSTER => QVariant::from(&item.has_poster),
-                _ => QVariant::default(),
-            };
+            return media_role_value(item, role);
         }
         QVariant::default()
     }
 
     pub fn role_names(&self) -> QHash<QHashPair_i32_QByteArray> {
         let mut roles = QHash::<QHashPair_i32_QByteArray>::default();
-        roles.insert(MEDIA_ROLE_ID, QByteArray::from("itemId"));
-        roles.insert(MEDIA_ROLE_TITLE, QByteArray::from("title"));
-        roles.insert(MEDIA_ROLE_NATIVE_TITLE, QByteArray::from("nativeTitle"));
-        roles.insert(MEDIA_ROLE_ROMAJI_TITLE, QByteArray::from("romajiTitle"));
-        roles.insert(MEDIA_ROLE_YEAR, QByteArray::from("year"));
-        roles.insert(MEDIA_ROLE_MEDIA_TYPE, QByteArray::from("mediaType"));
-        roles.insert(MEDIA_ROLE_STATUS, QByteArray::from("status"));
-        roles.insert(MEDIA_ROLE_QUALITY_TYPE, QByteArray::from("qualityType"));
-        roles.insert(MEDIA_ROLE_SOURCE, QByteArray::from("source"));
-        roles.insert(MEDIA_ROLE_NOTES, QByteArray::from("notes"));
-        roles.insert(MEDIA_ROLE_POSTER_PATH, QByteArray::from("posterPath"));
-        roles.insert(MEDIA_ROLE_HAS_POSTER, QByteArray::from("hasPoster"));
+        for (role, name) in MEDIA_ROLES {
+            roles.insert(role, QByteArray::from(name));
+        }
         roles
     }
 
+    /// All roles of one row as a JS object keyed by role name, so QML can
+    /// read a whole item in one call instead of one `data()` call per field.
+    pub fn get_item(&self, row: i32) -> QMap<QMapPair_QString_QVariant> {
+        let mut map = QMap::<QMapPair_QString_QVariant>::default();
+        if let Some(item) = self.items.get(row as usize) {
+            for (role, name) in MEDIA_ROLES {
+                map.insert(QString::from(name), media_role_value(item, role));
+            }
+        }
+        map
+    }
+
     pub fn row_count(&self, _parent: &QModelIndex) -> i32 {
         self.items.len() as i32
     }
 
-    pub fn reload(mut self: Pin<&mut Self>, page: &QString, status: &QString, search: &QString, sort_field: &QString, sort_dir: &QString) {
-        let page_str = page.to_string();
-        let status_str = status.to_string();
-        let search_str = search.to_string();
-        let sort_f = sort_field.to_string();
-        let sort_d = sort_dir.to_string();
+    pub fn can_fetch_more(&self, _parent: &QModelIndex) -> bool {
+        self.has_more
+    }
 
-        let state = get_app_state();
-        let conn = state.db.lock().unwrap();
+    pub fn fetch_more(mut self: Pin<&mut Self>, _parent: &QModelIndex) {
+        if !self.has_more {
+            return;
+        }
+        let first = self.items.len();
+        let page = self.as_mut().rust_mut().load_page(first);
+        if page.is_empty() {
+            return;
+        }
+        let last = first + page.len() - 1;
 
-        let db_items = if search_str.is_empty() {
-            db::queries::get_items_sorted(&conn, Some(&page_str), Some(&status_str), &sort_f, &sort_d).unwrap_or_default()
-        } else {
-            db::queries::search_items(&conn, &search_str, Some(&page_str), Some(&status_str)).unwrap_or_default()
-        };
-        drop(conn);
+        unsafe {
+            self.as_mut().begin_insert_rows_media(&QModelIndex::default(), first as i32, last as i32);
+            self.as_mut().rust_mut().items.extend(page);
+            self.as_mut().end_insert_rows_media();
+        }
+    }
 
-        let data_dir = &state.data_dir;
-        let display_items: Vec<DisplayItem> = db_items
-            .iter()
-            .map(|item| {
-                let (poster_path, has_poster) = resolve_poster(item.poster_url.as_deref(), data_dir);
-                DisplayItem {
-                    id: item.id.unwrap_or(-1) as i32,
-                    title: item.title.clone(),
-                    native_title: item.native_title.clone().unwrap_or_default(),
-                    romaji_title: item.romaji_title.clone().unwrap_or_default(),
-                    year: item.year.unwrap_or(0),
-                    media_type: item.media_type.clone(),
-                    status: item.status.clone(),
-                    quality_type: item.quality_type.clone().unwrap_or_default(),
-                    source: item.source.clone().unwrap_or_default(),
-                    notes: item.notes.clone().unwrap_or_default(),
-                    poster_path,
-                    has_poster,
-                }
-            })
-            .collect();
+    pub fn reload(mut self: Pin<&mut Self>, page: &QString, status: &QString, search: &QString, sort_field: &QString, sort_dir: &QString) {
+        self.as_mut().rust_mut().query = ItemQuery {
+            page: page.to_string(),
+            status: status.to_string(),
+            search: search.to_string(),
+            sort_field: sort_field.to_string(),
+            sort_dir: sort_dir.to_string(),
+        };
+        self.as_mut().rust_mut().interned.clear();
+        let display_items = self.as_mut().rust_mut().load_page(0);
 
         unsafe {
             self.as_mut().begin_reset_model_media();
@@ -253,6 +388,36 @@ impl qobject::MediaModel {
         }
     }
 
+    /// Drop the rows with the given ids (comma-separated), e.g. after they
+    /// were deleted or moved to another tab, without re-querying the rest.
+    pub fn remove_items(mut self: Pin<&mut Self>, ids: &QString) {
+        let ids: HashSet<i32> = ids
+            .to_string()
+            .split(',')
+            .filter_map(|s| s.trim().parse().ok())
+            .collect();
+
+        // Walk backwards so row numbers ahead of the cursor stay valid, and
+        // remove each run of adjacent rows in one step.
+        let mut end = self.items.len();
+        while end > 0 {
+            if !ids.contains(&self.items[end - 1].id) {
+                end -= 1;
+                continue;
+            }
+            let mut start = end - 1;
+            while start > 0 && ids.contains(&self.items[start - 1].id) {
+                start -= 1;
+            }
+            unsafe {
+                self.as_mut().begin_remove_rows_media(&QModelIndex::default(), start as i32, end as i32 - 1);
+                self.as_mut().rust_mut().items.drain(start..end);
+                self.as_mut().end_remove_rows_media();
+            }
+            end = start;
+        }
+    }
+
     pub fn get_item_id(&self, row: i32) -> i32 {
         self.items.get(row as usize).map(|i| i.id).unwrap_or(-1)
     }
@@ -260,25 +425,64 @@ impl qobject::MediaModel {
     pub fn get_item_title(&self, row: i32) -> QString {
         self.items
             .get(row as usize)
-            .map(|i| QString::from(&i.title))
+            .map(|i| QString::from(&*i.title))
             .unwrap_or_default()
     }
 
     pub fn get_item_native_title(&self, row: i32) -> QString {
         self.items
             .get(row as usize)
-            .map(|i| QString::from(&i.native_title))
+            .map(|i| QString::from(&*i.native_title))
             .unwrap_or_default()
     }
 
     pub fn get_item_romaji_title(&self, row: i32) -> QString {
         self.items
             .get(row as usize)
-            .map(|i| QString::from(&i.romaji_title))
+            .map(|i| QString::from(&*i.romaji_title))
             .unwrap_or_default()
     }
 }
 
+fn media_role_value(item: &DisplayItem, role: i32) -> QVariant {
+    match role {
+        MEDIA_ROLE_ID => QVariant::from(&item.id),
+        MEDIA_ROLE_TITLE => QVariant::from(&QString::from(&*item.title)),
+        MEDIA_ROLE_NATIVE_TITLE => QVariant::from(&QString::from(&*item.native_title)),
+        MEDIA_ROLE_ROMAJI_TITLE => QVariant::from(&QString::from(&*item.romaji_title)),
+        MEDIA_ROLE_YEAR => QVariant::from(&item.year),
+        MEDIA_ROLE_MEDIA_TYPE => QVariant::from(&QString::from(&*item.media_type)),
+        MEDIA_ROLE_STATUS => QVariant::from(&QString::from(&*item.status)),
+        MEDIA_ROLE_QUALITY_TYPE => QVariant::from(&QString::from(&*item.quality_type)),
+        MEDIA_ROLE_SOURCE => QVariant::from(&QString::from(&*item.source)),
+        MEDIA_ROLE_NOTES => QVariant::from(&QString::from(&*item.notes)),
+        MEDIA_ROLE_POSTER_PATH => QVariant::from(&QString::from(&*item.poster_path)),
+        MEDIA_ROLE_HAS_POSTER => QVariant::from(&!item.poster_path.is_empty()),
+        _ => QVariant::default(),
+    }
+}
+
+/// Resolved URL for a stored poster path, or `None` when there's no poster
+/// to show.
+fn resolve_poster_cached(
+    cache: &mut HashMap<String, Arc<str>>,
+    poster_url: Option<&str>,
+    data_dir: &std::path::Path,
+) -> Option<Arc<str>> {
+    let url = poster_url?;
+    if let Some(path) = cache.get(url) {
+        return Some(path.clone());
+    }
+    // Only hits are remembered: a missing poster may be downloaded later.
+    let (path, has_poster) = resolve_poster(Some(url), data_dir);
+    if !has_poster {
+        return None;
+    }
+    let path: Arc<str> = path.into();
+    cache.insert(url.to_string(), path.clone());
+    Some(path)
+}
+
 fn resolve_poster(poster_url: Option<&str>, data_dir: &std::path::Path) -> (String, bool) {
     if let Some(raw_url) = poster_url {
         let url = raw_url.trim();
@@ -316,93 +520,108 @@ const SEARCH_ROLE_POSTER_PATH: i32 = 261;
 const SEARCH_ROLE_HAS_POSTER: i32 = 262;
 const SEARCH_ROLE_SELECTED: i32 = 263;
 const SEARCH_ROLE_INDEX: i32 = 264;
-
-struct SearchItem {
-    title: String,
-    native_title: String,
-    romaji_title: String,
-    year: i32,
-    overview: String,
-    poster_path: String,
-    has_poster: bool,
-    selected: bool,
-    index: i32,
-}
+const SEARCH_ROLE_THUMB_PATH: i32 = 265;
+
+/// Every role with the name QML sees it under.
+const SEARCH_ROLES: [(i32, &str); 10] = [
+    (SEARCH_ROLE_TITLE, "title"),
+    (SEARCH_ROLE_NATIVE_TITLE, "nativeTitle"),
+    (SEARCH_ROLE_ROMAJI_TITLE, "romajiTitle"),
+    (SEARCH_ROLE_YEAR, "year"),
+    (SEARCH_ROLE_OVERVIEW, "overview"),
+    (SEARCH_ROLE_POSTER_PATH, "posterPath"),
+    (SEARCH_ROLE_HAS_POSTER, "hasPoster"),
+    (SEARCH_ROLE_SELECTED, "selected"),
+    (SEARCH_ROLE_INDEX, "resultIndex"),
+    (SEARCH_ROLE_THUMB_PATH, "thumbPath"),
+];
 
 #[derive(Default)]
 pub struct SearchModelRust {
-    items: Vec<SearchItem>,
+    /// Shared with `AppState::search_results`; rows read straight from it.
+    items: Arc<Vec<SearchResult>>,
+    selected: Vec<bool>,
     selected_count: i32,
 }
 
+impl SearchModelRust {
+    /// Flip `row`'s selection and return the new selected count, or `None`
+    /// for a row that doesn't exist. Only this row changed, so the count is
+    /// adjusted rather than rescanned; the caller stores it through the
+    /// property setter.
+    fn toggle(&mut self, row: usize) -> Option<i32> {
+        let selected = self.selected.get_mut(row)?;
+        *selected = !*selected;
+        let delta = if *selected { 1 } else { -1 };
+        Some(self.selected_count + delta)
+    }
+}
+
 impl qobject::SearchModel {
     pub fn data(&self, index: &QModelIndex, role: i32) -> QVariant {
-        let row = index.row() as usize;
-        if let Some(item) = self.items.get(row) {
-            return match role {
-                SEARCH_ROLE_TITLE => QVariant::from(&QString::from(&item.title)),
-                SEARCH_ROLE_NATIVE_TITLE => QVariant::from(&QString::from(&item.native_title)),
-                SEARCH_ROLE_ROMAJI_TITLE => QVariant::from(&QString::from(&item.romaji_title)),
-                SEARCH_ROLE_YEAR => QVariant::from(&item.year),
-                SEARCH_ROLE_OVERVIEW => QVariant::from(&QString::from(&item.overview)),
-                SEARCH_ROLE_POSTER_PATH => QVariant::from(&QString::from(&item.poster_path)),
-                SEARCH_ROLE_HAS_POSTER => QVariant::from(&item.has_poster),
-                SEARCH_ROLE_SELECTED => QVariant::from(&item.selected),
-                SEARCH_ROLE_INDEX => QVariant::from(&item.index),
-                _ => QVariant::default(),
-            };
-        }
-        QVariant::default()
+        self.search_role_value(index.row() as usize, role)
     }
 
     pub fn role_names(&self) -> QHash<QHashPair_i32_QByteArray> {
         let mut roles = QHash::<QHashPair_i32_QByteArray>::default();
-        roles.insert(SEARCH_ROLE_TITLE, QByteArray::from("title"));
-        roles.insert(SEARCH_ROLE_NATIVE_TITLE, QByteArray::from("nativeTitle"));
-        roles.insert(SEARCH_ROLE_ROMAJI_TITLE, QByteArray::from("romajiTitle"));
-        roles.insert(SEARCH_ROLE_YEAR, QByteArray::from("year"));
-        roles.insert(SEARCH_ROLE_OVERVIEW, QByteArray::from("overview"));
-        roles.insert(SEARCH_ROLE_POSTER_PATH, QByteArray::from("posterPath"));
-        roles.insert(SEARCH_ROLE_HAS_POSTER, QByteArray::from("hasPoster"));
-        roles.insert(SEARCH_ROLE_SELECTED, QByteArray::from("selected"));
-        roles.insert(SEARCH_ROLE_INDEX, QByteArray::from("resultIndex"));
+        for (role, name) in SEARCH_ROLES {
+            roles.insert(role, QByteArray::from(name));
+        }
         roles
     }
 
+    /// All roles of one result as a JS object keyed by role name, like
+    /// `MediaModel::get_item`.
+    pub fn get_item(&self, row: i32) -> QMap<QMapPair_QString_QVariant> {
+        let mut map = QMap::<QMapPair_QString_QVariant>::default();
+        if (row as usize) < self.items.len() {
+            for (role, name) in SEARCH_ROLES {
+                map.insert(QString::from(name), self.search_role_value(row as usize, role));
+            }
+        }
+        map
+    }
+
+    fn search_role_value(&self, row: usize, role: i32) -> QVariant {
+        let Some(item) = self.items.get(row) else {
+            return QVariant::default();
+        };
+        // Use the original remote URL directly — QML Image can load HTTP URLs
+        let poster_path = item.poster_url.as_deref().unwrap_or_default();
+        match role {
+            SEARCH_ROLE_TITLE => QVariant::from(&QString::from(&*item.title)),
+            SEARCH_ROLE_NATIVE_TITLE => QVariant::from(&QString::from(
+                item.native_title.as_deref().unwrap_or_default(),
+            )),
+            SEARCH_ROLE_ROMAJI_TITLE => QVariant::from(&QString::from(
+                item.romaji_title.as_deref().unwrap_or_default(),
+            )),
+            SEARCH_ROLE_YEAR => QVariant::from(&item.year.unwrap_or(0)),
+            SEARCH_ROLE_OVERVIEW => QVariant::from(&QString::from(
+                item.overview.as_deref().unwrap_or_default(),
+            )),
+            SEARCH_ROLE_POSTER_PATH => QVariant::from(&QString::from(poster_path)),
+            SEARCH_ROLE_HAS_POSTER => QVariant::from(&!poster_path.is_empty()),
+            SEARCH_ROLE_SELECTED => QVariant::from(&self.selected[row]),
+            SEARCH_ROLE_INDEX => QVariant::from(&(row as i32)),
+            SEARCH_ROLE_THUMB_PATH => QVariant::from(&QString::from(
+                item.thumbnail_url.as_deref().unwrap_or(poster_path),
+            )),
+            _ => QVariant::default(),
+        }
+    }
+
     pub fn row_count(&self, _parent: &QModelIndex) -> i32 {
         self.items.len() as i32
     }
 
     pub fn load_from_state(mut self: Pin<&mut Self>) {
         let state = get_app_state();
-        let results = state.search_results.lock().unwrap();
-
-        let items: Vec<SearchItem> = results
-            .iter()
-            .enumerate()
-            .map(|(i, r)| {
-                // Use the original remote URL directly — QML Image can load HTTP URLs
-                let poster_path = r.poster_url.clone().unwrap_or_default();
-                let has_poster = !poster_path.is_empty();
-
-                SearchItem {
-                    title: r.title.clone(),
-                    native_title: r.native_title.clone().unwrap_or_default(),
-                    romaji_title: r.romaji_title.clone().unwrap_or_default(),
-                    year: r.year.unwrap_or(0),
-                    overview: r.overview.clone().unwrap_or_default(),
-                    poster_path,
-                    has_poster,
-                    selected: false,
-                    index: i as i32,
-                }
-            })
-            .collect();
-
-        drop(results);
+        let items = state.search_results.lock().unwrap().clone();
 
         unsafe {
             self.as_mut().begin_reset_model_search();
+            self.as_mut().rust_mut().selected = vec![false; items.len()];
             self.as_mut().rust_mut().items = items;
             self.as_mut().set_selected_count(0);
             self.as_mut().end_reset_model_search();
@@ -410,35 +629,68 @@ impl qobject::SearchModel {
     }
 
     pub fn toggle_selection(mut self: Pin<&mut Self>, row: i32) {
-        if let Some(item) = self.as_mut().rust_mut().items.get_mut(row as usize) {
-            item.selected = !item.selected;
-        }
-        let count = self.items.iter().filter(|i| i.selected).count() as i32;
+        let Some(count) = self.as_mut().rust_mut().toggle(row as usize) else {
+            return;
+        };
         self.as_mut().set_selected_count(count);
 
-        // Notify QML the data changed - trigger full reset for simplicity
-        unsafe {
-            self.as_mut().begin_reset_model_search();
-            self.as_mut().end_reset_model_search();
-        }
+        // Only this row's selection changed; a model reset would rebuild
+        // every delegate in the list.
+        let index = self.index(row, 0, &QModelIndex::default());
+        let mut roles = QList::<i32>::default();
+        roles.append(SEARCH_ROLE_SELECTED);
+        self.as_mut().data_changed(&index, &index, &roles);
     }
 
     pub fn get_selected_indices(&self) -> QString {
-        let indices: Vec<String> = self
-            .items
-            .iter()
-            .filter(|i| i.selected)
-            .map(|i| i.index.to_string())
-            .collect();
-        QString::from(&indices.join(","))
+        // Written straight into one buffer rather than a String per index.
+        let mut indices = String::new();
+        for (i, _) in self.selected.iter().enumerate().filter(|(_, &s)| s) {
+            if !indices.is_empty() {
+                indices.push(',');
+            }
+            let _ = write!(indices, "{i}");
+        }
+        QString::from(&indices)
     }
 
     pub fn clear(mut self: Pin<&mut Self>) {
         unsafe {
             self.as_mut().begin_reset_model_search();
-            self.as_mut().rust_mut().items.clear();
+            self.as_mut().rust_mut().items = Arc::default();
+            self.as_mut().rust_mut().selected.clear();
             self.as_mut().set_selected_count(0);
             self.as_mut().end_reset_model_search();
         }
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn toggle_twice_restores_selected_count() {
+        let mut model = SearchModelRust {
+            selected: vec![false; 3],
+            ..Default::default()
+        };
+
+        model.selected_count = model.toggle(1).unwrap();
+        assert_eq!(model.selected_count, 1);
+        model.selected_count = model.toggle(1).unwrap();
+        assert_eq!(model.selected_count, 0);
+        assert_eq!(model.selected, vec![false; 3]);
+    }
+
+    #[test]
+    fn toggle_out_of_range_row_is_ignored() {
+        let mut model = SearchModelRust {
+            selected: vec![false; 2],
+            ..Default::default()
+        };
+
+        assert_eq!(model.toggle(2), None);
+        assert_eq!(model.selected_count, 0);
+    }
+}
@@ -29,4 +29,6 @@ fn main() {
     if let Some(app) = app.as_mut() {
         app.exec();
     }
+
+    bridge::shutdown_app_state();
 }
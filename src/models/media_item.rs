@@ -28,6 +28,9 @@ pub struct SearchResult {
     pub year: Option<i32>,
     pub overview: Option<String>,
     pub poster_url: Option<String>,
+    /// Small variant of the poster for the results list. `poster_url` is
+    /// still what gets downloaded when the item is added.
+    pub thumbnail_url: Option<String>,
 }
 
 #[derive(Debug, Clone, Serialize, Deserialize)]